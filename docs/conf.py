@@ -416,12 +416,11 @@ if os.getenv("FETCH_REMOTE_RESOURCES", "false").lower() == "true":
     )
 else:
     import json
-    from collections import OrderedDict
-    from jsonref import JsonRef
     from civis.resources import API_SPEC_PATH
+    from civis.resources._resources import resolve_refs
 
     with open(API_SPEC_PATH) as _raw:
-        api_spec = JsonRef.replace_refs(json.load(_raw, object_pairs_hook=OrderedDict))
+        api_spec = resolve_refs(json.load(_raw))
     extra_classes = civis.resources._resources.parse_api_spec(api_spec, "1.0")
 
 sorted_class_names = sorted(extra_classes.keys())
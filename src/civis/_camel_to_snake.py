@@ -2,6 +2,7 @@
 # To avoid creating import overhead, it's defined in a separate module here
 # as opposed to in a module that itself has a fair amount of overhead.
 
+import functools
 import re
 
 
@@ -9,6 +10,9 @@ UNDERSCORER1 = re.compile(r"(.)([A-Z][a-z]+)")
 UNDERSCORER2 = re.compile("([a-z0-9])([A-Z])")
 
 
+# The same API field names get converted over and over,
+# both when generating the API client and in every response.
+@functools.lru_cache(maxsize=4096)
 def camel_to_snake(word):
     # https://gist.github.com/jaytaylor/3660565
     word = UNDERSCORER1.sub(r"\1_\2", word)
@@ -1,3 +1,4 @@
+import contextlib
 import os
 import sys
 import threading
@@ -12,20 +13,20 @@ import civis
 from civis.response import PaginatedResponse, convert_response_data_type
 from civis._utils import retry_request, DEFAULT_RETRYING
 
-FINISHED = ["success", "succeeded"]
-FAILED = ["failed"]
-NOT_FINISHED = ["queued", "running"]
-CANCELLED = ["cancelled"]
-DONE = FINISHED + FAILED + CANCELLED
+FINISHED = frozenset({"success", "succeeded"})
+FAILED = frozenset({"failed"})
+NOT_FINISHED = frozenset({"queued", "running"})
+CANCELLED = frozenset({"cancelled"})
+DONE = FINISHED | FAILED | CANCELLED
+
+_FAILED_STATE = "failed"
 
 # Translate Civis state strings into `future` state strings
-STATE_TRANS = {}
-for name in FINISHED + FAILED:
-    STATE_TRANS[name] = futures._base.FINISHED
-for name in NOT_FINISHED:
-    STATE_TRANS[name] = futures._base.RUNNING
-for name in CANCELLED:
-    STATE_TRANS[name] = futures._base.CANCELLED_AND_NOTIFIED
+STATE_TRANS = {
+    **dict.fromkeys(FINISHED | FAILED, futures._base.FINISHED),
+    **dict.fromkeys(NOT_FINISHED, futures._base.RUNNING),
+    **dict.fromkeys(CANCELLED, futures._base.CANCELLED_AND_NOTIFIED),
+}
 
 
 DEFAULT_API_ENDPOINT = "https://api.civisanalytics.com/"
@@ -97,6 +98,34 @@ class CivisImportError(Exception):
     pass
 
 
+class _ConditionalGet:
+    """State of a conditional GET, see :func:`_conditional_get`."""
+
+    def __init__(self, etag):
+        self.etag = etag
+        self.not_modified = False
+
+
+_conditional_get_local = threading.local()
+
+
+@contextlib.contextmanager
+def _conditional_get(etag):
+    """Make the GET requests in this thread conditional on `etag`.
+
+    Within this context, GET requests made by an :class:`Endpoint` send
+    an ``If-None-Match`` header if `etag` isn't ``None``. The yielded
+    object records whether the server responded with 304 Not Modified,
+    and otherwise the ETag of the last response.
+    """
+    conditional = _ConditionalGet(etag)
+    _conditional_get_local.current = conditional
+    try:
+        yield conditional
+    finally:
+        _conditional_get_local.current = None
+
+
 def get_base_url():
     base_url = os.environ.get("CIVIS_API_ENDPOINT", DEFAULT_API_ENDPOINT)
     if not base_url.endswith("/"):
@@ -141,6 +170,15 @@ class Endpoint:
         url = self._build_path(path)
         params = self._handle_array_params(params)
 
+        conditional = None
+        if method.upper() == "GET":
+            conditional = getattr(_conditional_get_local, "current", None)
+        if conditional is not None and conditional.etag is not None:
+            kwargs["headers"] = {
+                **kwargs.get("headers", {}),
+                "If-None-Match": conditional.etag,
+            }
+
         with self._lock:
             if self._client._retrying is None:
                 retrying = self._session_kwargs.pop("retrying", None)
@@ -161,6 +199,11 @@ class Endpoint:
         if not response.ok:
             raise CivisAPIError(response)
 
+        if conditional is not None:
+            conditional.not_modified = response.status_code == 304
+            if not conditional.not_modified:
+                conditional.etag = response.headers.get("ETag")
+
         return response
 
     def _call_api(
@@ -182,6 +225,15 @@ class Endpoint:
             resp = PaginatedResponse(path, params, self)
         else:
             resp = self._make_request(method, path, params, data, **kwargs)
+            conditional = getattr(_conditional_get_local, "current", None)
+            if (
+                conditional is not None
+                and conditional.not_modified
+                and method.upper() == "GET"
+            ):
+                # A 304 has no body. The caller already has the unchanged
+                # result, so neither convert nor store this response.
+                return resp
             resp = convert_response_data_type(
                 resp,
                 return_type=self._return_type,
@@ -207,27 +259,61 @@ class CivisAsyncResultBase(futures.Future):
         # Almost the same as the superclass's __repr__, except we use
         # the `_civis_state` rather than the `_state`.
         with self._condition:
-            if self._civis_state in FINISHED + FAILED:
-                if self.exception():
-                    return "<%s at %#x state=%s raised %s>" % (
-                        self.__class__.__name__,
-                        id(self),
-                        self._civis_state,
-                        self._exception.__class__.__name__,
-                    )
+            state = self._civis_state
+            prefix = f"<{self.__class__.__name__} at {id(self):#x} state={state}"
+            if state in FINISHED | FAILED:
+                if self._exception is not None:
+                    return f"{prefix} raised {self._exception.__class__.__name__}>"
                 else:
-                    return "<%s at %#x state=%s returned %s>" % (
-                        self.__class__.__name__,
-                        id(self),
-                        self._civis_state,
-                        self.result().__class__.__name__,
-                    )
-            out = "<%s at %#x state=%s>" % (
-                self.__class__.__name__,
-                id(self),
-                self._civis_state,
-            )
-            return out
+                    return f"{prefix} returned {self._result.__class__.__name__}>"
+            return f"{prefix}>"
+
+    def __await__(self):
+        """Wait for the job from within an :mod:`asyncio` event loop.
+
+        ``await future`` returns the result or raises the exception,
+        like ``future.result()``, without blocking the event loop.
+        """
+        # Only asyncio users need asyncio, so don't import it up front.
+        import asyncio
+
+        # Don't use `asyncio.wrap_future`, which would pass a cancellation of
+        # the awaiting task (e.g., by `asyncio.wait_for` timing out) on to
+        # `self.cancel()`. That raises for most Civis futures, and for
+        # a `ContainerFuture` it would cancel the job in Civis Platform.
+        loop = asyncio.get_running_loop()
+        waiter = loop.create_future()
+
+        def _copy_state(fut):
+            if waiter.done():
+                return
+            # `fut` is done, so read its outcome directly rather than through
+            # `exception()` and `result()`, which would wait for its lock.
+            if fut.cancelled():
+                waiter.cancel()
+            elif fut._exception is not None:
+                waiter.set_exception(fut._exception)
+            else:
+                waiter.set_result(fut._result)
+
+        def _on_done(fut):
+            # Done-callbacks run in a polling thread, not the loop's thread.
+            try:
+                loop.call_soon_threadsafe(_copy_state, fut)
+            except RuntimeError:
+                # The event loop has been closed; nobody is waiting anymore.
+                pass
+
+        # Not `self.add_done_callback`, which checks the state and so could
+        # poll Civis Platform right here, blocking the event loop.
+        with self._condition:
+            done = self._result is not None or self._exception is not None
+            if not done:
+                self._done_callbacks.append(_on_done)
+                self._ensure_polling(immediately=True)
+        if done:
+            _on_done(self)
+        return waiter.__await__()
 
     def cancel(self):
         """Not currently implemented."""
@@ -235,32 +321,39 @@ class CivisAsyncResultBase(futures.Future):
 
     def succeeded(self):
         """Return ``True`` if the job completed in Civis with no error."""
-        with self._condition:
-            return self._civis_state in FINISHED
+        return self._civis_state in FINISHED
 
     def failed(self):
         """Return ``True`` if the Civis job failed."""
-        with self._condition:
-            return self._civis_state in FAILED
+        return self._civis_state in FAILED
 
     def _check_result(self):
-        with self._condition:
-            if self._result is not None:
-                return self._result
+        # The result is only ever set once the job is done, so it can be
+        # read without waiting for the lock.
+        return self._result
+
+    def _ensure_polling(self, immediately=False):
+        """Make sure the result gets set in the background.
+
+        Sub-classes which poll for their result start polling here,
+        without polling in the calling thread.
+        """
 
     @property
     def _civis_state(self):
         """State as returned from Civis."""
-        with self._condition:
-            if self._check_result():
-                return self._check_result().state
-            return "running"
+        result = self._result
+        if result is None:
+            with self._condition:
+                result = self._check_result()
+        if result:
+            return result.state
+        return "running"
 
     @property
     def _state(self):
         """State of the CivisAsyncResultBase in `future` language."""
-        with self._condition:
-            return STATE_TRANS[self._civis_state]
+        return STATE_TRANS[self._civis_state]
 
     @_state.setter
     def _state(self, value):
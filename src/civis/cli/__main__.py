@@ -9,7 +9,6 @@ https://github.com/zalando/openapi-cli-client/blob/master/LICENSE
 """
 
 import calendar
-from collections import OrderedDict
 from functools import partial
 import json
 import logging
@@ -20,7 +19,6 @@ import time
 from warnings import warn
 
 import click
-from jsonref import JsonRef
 import yaml
 from requests import Request
 
@@ -40,11 +38,12 @@ from civis.cli._cli_commands import (
 )
 from civis.base import open_session
 from civis.resources import get_api_spec, CACHED_SPEC_PATH
-from civis.resources._resources import parse_method_name
+from civis.resources._resources import parse_method_name, resolve_refs
 from civis._utils import retry_request
 
 
 _REPLACEABLE_COMMAND_CHARS = re.compile(r"[^A-Za-z0-9]+")
+_UPPERCASE_RUNS = re.compile(r"([A-Z]+)")
 _BASE_API_URL = "https://api.civisanalytics.com"
 CLI_USER_AGENT = "civis-cli"
 
@@ -97,7 +96,7 @@ def get_base_api_url():
 
 
 def camel_to_snake(s):
-    return re.sub(r"([A-Z]+)", r"_\1", s).lower()
+    return _UPPERCASE_RUNS.sub(r"_\1", s).lower()
 
 
 def munge_name(s):
@@ -214,7 +213,7 @@ def retrieve_spec_dict(api_version="1.0"):
         if now_timestamp - modified_time < 24 * 3600:
             refresh_spec = False
             with open(CACHED_SPEC_PATH) as f:
-                spec_dict = json.load(f, object_pairs_hook=OrderedDict)
+                spec_dict = json.load(f)
     except (FileNotFoundError, ValueError):
         # If the file doesn't exist or we can't parse it, just keep going.
         refresh_spec = True
@@ -259,7 +258,7 @@ def generate_cli():
 
     # Replace references in the spec so that we don't have to worry about them
     # when making the CLI.
-    spec = JsonRef.replace_refs(spec)
+    spec = resolve_refs(spec)
 
     cli = click.Group()
     cli = click.version_option(version=civis.__version__, package_name="civis")(cli)
@@ -12,7 +12,6 @@ from civis._utils import get_api_key, DEFAULT_RETRYING_STR
 from civis.response import _RETURN_TYPES, find, find_one
 
 if TYPE_CHECKING:
-    import collections
     import tenacity
 
 
@@ -37,13 +36,13 @@ class APIClient:
     api_version : string, optional
         The version of endpoints to call. May instantiate multiple client
         objects with different versions. Currently only "1.0" is supported.
-    local_api_spec : collections.OrderedDict or string, optional
+    local_api_spec : dict or string, optional
         The methods on this class are dynamically built from the Civis API
         specification, which can be retrieved from the /endpoints endpoint.
         When local_api_spec is None, the default, this specification is
         downloaded the first time APIClient is instantiated. Alternatively,
         a local cache of the specification may be passed as either an
-        OrderedDict or a filename which points to a json file.
+        dict or a filename which points to a json file.
     force_refresh_api_spec : bool, optional
         Whether to force re-downloading the API spec,
         even if the cached version for the given API key hasn't expired.
@@ -66,7 +65,7 @@ class APIClient:
         api_key: str | None = None,
         return_type: str = "snake",
         api_version: str = "1.0",
-        local_api_spec: collections.OrderedDict | str | None = None,
+        local_api_spec: dict | str | None = None,
         force_refresh_api_spec: bool = False,
         retries: tenacity.Retrying | None = None,
     ):
@@ -1,7 +1,6 @@
 # This file is auto-generated by tools/update_civis_api_spec.py.
 # Do not edit it by hand.
 
-from collections import OrderedDict
 from collections.abc import Iterator
 from typing import Any, List
 
@@ -81885,7 +81884,7 @@ class APIClient:
         api_key: str | None = ...,
         return_type: str = ...,
         api_version: str = ...,
-        local_api_spec: OrderedDict | str | None = ...,
+        local_api_spec: dict | str | None = ...,
         force_refresh_api_spec: bool = ...,
     ): ...
     def get_aws_credential_id(
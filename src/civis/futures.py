@@ -43,6 +43,10 @@ class CivisFuture(PollableResult):
         If ``True`` (the default), it will poll upon calling ``result()`` the
         first time. If ``False``, it will wait the number of seconds specified
         in `polling_interval` from object creation before polling.
+    adaptive : bool, optional
+        If ``True``, poll less often while the job's state stays the same.
+        See :class:`~civis.polling.PollableResult` for details.
+        Defaults to ``False``.
 
     Examples
     --------
@@ -74,21 +78,34 @@ class CivisFuture(PollableResult):
         polling_interval=None,
         client=None,
         poll_on_creation=True,
+        adaptive=False,
     ):
-        if client is None:
-            client = APIClient()
-
+        # If no client is given, wait to create a default one until it's needed.
+        # Creating an APIClient can require downloading the API spec,
+        # and many futures never make any API calls of their own.
         super().__init__(
             poller=poller,
             poller_args=poller_args,
             polling_interval=polling_interval,
             client=client,
             poll_on_creation=poll_on_creation,
+            adaptive=adaptive,
         )
 
         self._exception_handled = False
         self.add_done_callback(self._set_job_exception)
 
+    @property
+    def client(self):
+        """The :class:`civis.APIClient` used for API calls about the job."""
+        if self._client is None:
+            self._client = APIClient()
+        return self._client
+
+    @client.setter
+    def client(self, client):
+        self._client = client
+
     @staticmethod
     def _set_job_exception(fut):
         """Callback: On job completion, check the status.
@@ -251,6 +268,10 @@ class ContainerFuture(CivisFuture):
         If ``True`` (the default), it will poll upon calling ``result()`` the
         first time. If ``False``, it will wait the number of seconds specified
         in `polling_interval` from object creation before polling.
+    adaptive : bool, optional
+        If ``True``, poll less often while the job's state stays the same.
+        See :class:`~civis.polling.PollableResult` for details.
+        Defaults to ``False``.
 
     See Also
     --------
@@ -265,6 +286,7 @@ class ContainerFuture(CivisFuture):
         polling_interval=None,
         client=None,
         poll_on_creation=True,
+        adaptive=False,
     ):
         if client is None:
             client = APIClient()
@@ -277,6 +299,7 @@ class ContainerFuture(CivisFuture):
             polling_interval=polling_interval,
             client=client,
             poll_on_creation=poll_on_creation,
+            adaptive=adaptive,
         )
 
     def _set_api_exception(self, exc, result=None):
@@ -291,15 +314,10 @@ class ContainerFuture(CivisFuture):
                 orig_run_id = self.run_id
                 self.poller_args[1] = run_id = self._last_result.id
                 self._max_n_retries -= 1
-                self._last_polled = time.time()
-
-                # Threads can only be started once, and the last thread
-                # stopped in cleanup. Start a new polling thread.
-                # Note that it's possible to have a race condition if
-                # you shut down the old thread too soon after starting it.
-                # In practice this only happens when testing retries
-                # with extremely short polling intervals.
-                self._begin_tracking(start_thread=True)
+                self._last_polled = time.monotonic()
+
+                # Polling stopped in cleanup. Start polling again for the new run.
+                self._begin_tracking(start_polling=True)
 
                 log.debug(
                     "Job ID %d / Run ID %d failed. Retrying "
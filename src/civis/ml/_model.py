@@ -545,9 +545,10 @@ class ModelFuture(ContainerFuture):
 
     def __getstate__(self):
         state = self.__dict__.copy()
-        del state["_polling_thread"]
-        del state["client"]
+        state["_poll_token"] = None
+        del state["_client"]
         del state["poller"]
+        del state["_invoke"]
         del state["_condition"]
         state["_done_callbacks"] = []
         state["_self_polling_executor"] = None
@@ -559,6 +560,8 @@ class ModelFuture(ContainerFuture):
         self._condition = threading.Condition()
         self.client = APIClient()
         self.poller = self.client.scripts.get_containers_runs
+        # Monotonic clock readings from another process aren't comparable.
+        self._last_polled = None
         self._next_polling_interval = 1
         self._use_geometric_polling = True
         self._begin_tracking()
@@ -1,41 +1,210 @@
+import functools
+import heapq
+import itertools
+import logging
+import os
+import queue
+import random
 import time
 import threading
 
-from civis.base import CivisJobFailure, CivisAsyncResultBase, FAILED, DONE
+import requests
+
+from civis.base import (
+    CivisAPIError,
+    CivisJobFailure,
+    CivisAsyncResultBase,
+    FAILED,
+    DONE,
+    _FAILED_STATE,
+    _conditional_get,
+)
 from civis.response import Response
 
 
+log = logging.getLogger(__name__)
+
 _MAX_POLLING_INTERVAL = 15
+# The longest polling interval that `adaptive` polling backs off to,
+# unless the job's `polling_interval` calls for longer.
+_ADAPTIVE_MAX_POLLING_INTERVAL = 120
+# The API calls made by pollers are I/O-bound and short,
+# so a handful of worker threads can keep up with many futures.
+_MAX_POLLING_WORKERS = 4
+# If no worker has picked up a due poll for this many seconds,
+# e.g. because they're all running slow done-callbacks or waiting out
+# rate limits, start another worker so other futures keep polling.
+_WORKER_STALL_TIMEOUT = 0.5
+# Workers started because of a stall exit after idling this many seconds.
+_IDLE_WORKER_TIMEOUT = 60
+# Stands in for the job's result when polling raises an exception.
+# Responses are immutable, so every failed future can share this one.
+_FAILED_SENTINEL = Response({"state": _FAILED_STATE})
+# Give up on a job after this many polls in a row fail with transient errors.
+_MAX_TRANSIENT_FAILURES = 5
 
 
-class _ResultPollingThread(threading.Thread):
-    """Poll a function until it returns a Response with a DONE state"""
+def _is_transient_error(exc):
+    """Is `exc` a network or server error that a later poll might not hit?"""
+    if isinstance(exc, (requests.ConnectionError, requests.Timeout)):
+        return True
+    if isinstance(exc, CivisAPIError):
+        return isinstance(exc.status_code, int) and exc.status_code >= 500
+    return False
 
-    # Inspired by `threading.Timer`
 
-    def __init__(self, pollable_result):
-        super().__init__(daemon=True)
-        self.pollable_result = pollable_result
-        self.finished = threading.Event()
+class _PollScheduler:
+    """Poll many pollable results from a single scheduling thread.
 
-    def cancel(self):
-        """Stop the poller if it hasn't finished yet."""
-        self.finished.set()
+    Pending polls are kept in a heap of ``(due time, tiebreaker, token)``
+    entries, and each token maps to the pollable it was registered for.
+    The scheduler holds on to a pollable until it's unregistered,
+    so a future keeps polling (and runs its done-callbacks) even if
+    the caller doesn't keep a reference to it.
+    The scheduling thread sleeps until the earliest due time and hands
+    due polls off to a small pool of worker threads, so the number of
+    threads doesn't grow with the number of futures being tracked.
+    A poll or done-callback can take a long time, though, so if due polls
+    sit waiting because every worker is busy, the scheduler starts
+    another worker for as long as it's needed.
+    All of these are daemon threads, so they never hold up interpreter exit.
+    An entry is dropped without polling if its pollable is no longer
+    tracking with the entry's token.
+    """
 
-    def join(self, timeout=None):
-        """Shut down the polling when the thread is terminated."""
-        self.cancel()
-        super().join(timeout=timeout)
+    def __init__(self, max_workers=_MAX_POLLING_WORKERS):
+        self._max_workers = max_workers
+        # Incremented in a forked child, where the parent's registrations
+        # no longer apply. See `PollableResult._check_result`.
+        self._generation = 0
+        self._reset()
 
-    def run(self):
-        """Poll until done."""
-        while not self.finished.wait(self.pollable_result._next_polling_interval):
-            # Spotty internet connectivity can result in polling functions
-            # returning None. This treats None responses like responses which
-            # have a non-DONE state.
-            poller_result = self.pollable_result._check_result()
-            if poller_result is not None and poller_result.state in DONE:
-                self.finished.set()
+    def _reset(self):
+        self._condition = threading.Condition()
+        self._heap = []
+        self._pollables = {}
+        self._counter = itertools.count()
+        self._worker_ids = itertools.count()
+        self._thread = None
+        self._work = queue.SimpleQueue()
+        # Polls handed off to the workers but not yet picked up,
+        # and when a worker last picked one up.
+        self._queued = 0
+        self._last_pickup = None
+
+    def _after_fork_in_child(self):
+        """Forget the parent process's polling in a forked child.
+
+        Only the thread that forked survives in the child, and polling
+        the parent's futures from every child would repeat the parent's
+        API calls. So the child starts with no registrations and no threads
+        (and a fresh lock, in case another thread held it during the fork).
+        Futures that the child goes on to use start polling again.
+        """
+        self._reset()
+        self._generation += 1
+
+    def _start_worker(self, idle_timeout=None):
+        # Called with `self._condition` held.
+        threading.Thread(
+            target=self._work_loop,
+            args=(idle_timeout,),
+            name=f"civis-polling-worker-{next(self._worker_ids)}",
+            daemon=True,
+        ).start()
+
+    def register(self, pollable, token, delay):
+        """Schedule ``pollable._scheduled_poll(token)`` in `delay` seconds."""
+        entry = (time.monotonic() + delay, next(self._counter), token)
+        with self._condition:
+            self._pollables[token] = pollable
+            heapq.heappush(self._heap, entry)
+            if self._thread is None:
+                for _ in range(self._max_workers):
+                    self._start_worker()
+                self._thread = threading.Thread(
+                    target=self._run, name="civis-polling-scheduler", daemon=True
+                )
+                self._thread.start()
+            self._condition.notify()
+
+    def unregister(self, token):
+        """Drop the pollable registered with `token`, and its scheduled polls.
+
+        Stale entries would be skipped when they come due anyway,
+        but dropping them right away lets the scheduling thread go back to
+        sleeping until the next live poll instead of waking up for nothing.
+        """
+        with self._condition:
+            self._pollables.pop(token, None)
+            heap = [entry for entry in self._heap if entry[2] is not token]
+            if len(heap) != len(self._heap):
+                heapq.heapify(heap)
+                self._heap = heap
+                self._condition.notify()
+
+    def _run(self):
+        """Dispatch polls as they come due."""
+        while True:
+            with self._condition:
+                now = time.monotonic()
+                timeout = self._heap[0][0] - now if self._heap else None
+                if self._queued:
+                    waited = now - self._last_pickup
+                    if waited >= _WORKER_STALL_TIMEOUT:
+                        # Every worker is tied up. Add one for the waiting polls.
+                        self._start_worker(idle_timeout=_IDLE_WORKER_TIMEOUT)
+                        self._last_pickup = now
+                        waited = 0
+                    stall_timeout = _WORKER_STALL_TIMEOUT - waited
+                    if timeout is None or timeout > stall_timeout:
+                        timeout = stall_timeout
+                if timeout is None or timeout > 0:
+                    # Wake up early if an earlier poll gets registered.
+                    self._condition.wait(timeout)
+                    continue
+                # Take every poll that's due in one pass,
+                # rather than waking up once per poll.
+                due = []
+                while self._heap and self._heap[0][0] <= now:
+                    _, _, token = heapq.heappop(self._heap)
+                    pollable = self._pollables.get(token)
+                    if pollable is not None:
+                        due.append((pollable, token))
+                if not self._queued:
+                    self._last_pickup = now
+                self._queued += len(due)
+            for item in due:
+                self._work.put(item)
+            # Don't keep the last pollables alive while waiting for the next poll.
+            due = pollable = None
+
+    def _work_loop(self, idle_timeout=None):
+        """Run due polls handed off by the scheduling thread.
+
+        If `idle_timeout` is given, exit after idling that many seconds.
+        """
+        while True:
+            try:
+                pollable, token = self._work.get(timeout=idle_timeout)
+            except queue.Empty:
+                with self._condition:
+                    if not self._queued:
+                        return
+                continue
+            with self._condition:
+                self._queued -= 1
+                self._last_pickup = time.monotonic()
+            try:
+                pollable._scheduled_poll(token)
+            except Exception:
+                log.exception("Unexpected error while polling %r", pollable)
+            del pollable
+
+
+_POLL_SCHEDULER = _PollScheduler()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_POLL_SCHEDULER._after_fork_in_child)
 
 
 class PollableResult(CivisAsyncResultBase):
@@ -66,6 +235,13 @@ class PollableResult(CivisAsyncResultBase):
         If ``True`` (the default), it will poll upon calling ``result()`` the
         first time. If ``False``, it will wait the number of seconds specified
         in `polling_interval` from object creation before polling.
+    adaptive : bool, optional
+        If ``True``, poll less often while the job's state stays the same,
+        e.g., for a long-running job. The polling interval starts at
+        `polling_interval` (or 1 second if that's ``None``), doubles after every
+        poll that sees no change, up to 120 seconds or 8 times `polling_interval`,
+        whichever is longer, and starts over whenever the job's state changes.
+        Defaults to ``False``.
 
     Examples
     --------
@@ -105,6 +281,7 @@ class PollableResult(CivisAsyncResultBase):
         polling_interval=None,
         client=None,
         poll_on_creation=True,
+        adaptive=False,
     ):
         super().__init__()
 
@@ -113,6 +290,7 @@ class PollableResult(CivisAsyncResultBase):
         self.polling_interval = polling_interval
         self.client = client
         self.poll_on_creation = poll_on_creation
+        self.adaptive = adaptive
 
         if self.polling_interval is not None and self.polling_interval <= 0:
             raise ValueError("The polling interval must be positive.")
@@ -124,29 +302,92 @@ class PollableResult(CivisAsyncResultBase):
         if poll_on_creation:
             self._last_polled = None
         else:
-            self._last_polled = time.time()
+            self._last_polled = time.monotonic()
         self._last_result = None
+        self._last_etag = None
+        self._transient_failures = 0
+        self._poll_token = None
+        self._poll_generation = None
+        # The most recently seen Civis state, reused for a short while
+        # so that repeated state checks don't each go through `_check_result`.
+        self._cached_state = None
+        self._cached_state_time = None
 
         self._begin_tracking()
 
-    def _begin_tracking(self, start_thread=False):
+    def _begin_tracking(self, start_polling=False):
         """Start monitoring the Civis Platform job"""
         with self._condition:
             if getattr(self, "poller", None) is None:
                 raise RuntimeError(
                     "Internal error: Must set polling "
-                    "function before initializing thread."
+                    "function before starting to poll."
                 )
-            self._reset_polling_thread(self.polling_interval, start_thread)
+            self._reset_polling(self.polling_interval, start_polling)
+
+    def _start_polling(self, immediately=False):
+        """Register with the shared scheduler, which polls until the job completes.
+
+        Each registration gets a new token. Scheduled polls carrying
+        any other token are stale and get dropped.
+        If `immediately` and there's been no poll yet, the scheduler
+        makes the first poll right away.
+        """
+        with self._condition:
+            self._poll_token = token = object()
+            self._poll_generation = _POLL_SCHEDULER._generation
+            if immediately and self._last_polled is None:
+                _POLL_SCHEDULER.register(self, token, 0)
+            else:
+                self._schedule_next_poll(token)
+
+    def _ensure_polling(self, immediately=False):
+        """Start polling in the background, unless it's running or done."""
+        with self._condition:
+            # Also start over in a forked child, whose scheduler has
+            # forgotten the parent process's registrations.
+            if self._result is None and (
+                self._poll_token is None
+                or self._poll_generation != _POLL_SCHEDULER._generation
+            ):
+                self._start_polling(immediately)
+
+    def _schedule_next_poll(self, token):
+        delay = self._next_polling_interval
+        if self._transient_failures:
+            # Back off with full jitter after transient failures.
+            backoff = min(_MAX_POLLING_INTERVAL, 2**self._transient_failures)
+            # The jitter only spreads out retries; it needs no cryptographic randomness.
+            delay = max(delay, random.uniform(0, backoff))  # nosec B311
+        if self._last_polled is not None:
+            delay -= time.monotonic() - self._last_polled
+        _POLL_SCHEDULER.register(self, token, max(delay, 0))
+
+    def _scheduled_poll(self, token):
+        """Poll on behalf of the scheduler, and reschedule until done."""
+        with self._condition:
+            if self._poll_token is not token:
+                return
+            # Spotty internet connectivity can result in polling functions
+            # returning None. This treats None responses like responses which
+            # have a non-DONE state.
+            poller_result = self._check_result()
+            if self._poll_token is token and (
+                poller_result is None or poller_result.state not in DONE
+            ):
+                self._schedule_next_poll(token)
 
     def _check_result(self):
         """Return the job result from Civis. Once the job completes, store the
         result and never poll again."""
+        # Once set, the result never changes, so there's no need for the lock.
+        result = self._result
+        if result is not None:
+            return result
         with self._condition:
-            # Start a single thread continuously polling.
+            # Start polling in the background.
             # It will stop once the job completes.
-            if not self._polling_thread.is_alive() and self._result is None:
-                self._polling_thread.start()
+            self._ensure_polling()
 
             if self._result is not None:
                 # If the job is already completed, just return the stored
@@ -155,9 +396,9 @@ class PollableResult(CivisAsyncResultBase):
 
             # Check to see if the job has finished, but don't poll more
             # frequently than the requested polling frequency.
-            now = time.time()
+            now = time.monotonic()
             if (
-                not self._last_polled
+                self._last_polled is None
                 or (now - self._last_polled) >= self._next_polling_interval
             ):
                 if self._use_geometric_polling:
@@ -175,40 +416,96 @@ class PollableResult(CivisAsyncResultBase):
                 # Poll for a new result
                 self._last_polled = now
                 try:
-                    self._last_result = self.poller(*self.poller_args)
+                    # Skip downloading and parsing the result
+                    # if it hasn't changed since the last poll.
+                    with _conditional_get(self._last_etag) as conditional:
+                        result = self._invoke()
+                    if conditional.not_modified:
+                        state_changed = False
+                    else:
+                        state_changed = self._state_changed(result)
+                        self._last_result = result
+                        self._last_etag = conditional.etag
+                    if self.adaptive:
+                        self._adapt_polling_interval(state_changed)
                 except Exception as e:
-                    # The _poller can raise API exceptions
-                    # Set those directly as this Future's exception
-                    self._set_api_exception(exc=e)
+                    if (
+                        _is_transient_error(e)
+                        and self._transient_failures < _MAX_TRANSIENT_FAILURES
+                    ):
+                        # Don't fail the job over a flaky connection or
+                        # an API hiccup. Try again at the next poll.
+                        self._transient_failures += 1
+                    else:
+                        # The _poller can raise API exceptions
+                        # Set those directly as this Future's exception
+                        self._set_api_exception(exc=e)
                 else:
+                    self._transient_failures = 0
                     # If the job has finished, then register completion and
                     # store the results. Because of the `if self._result` check
                     # up top, we will never get here twice.
-                    self._set_api_result(self._last_result)
+                    if self._last_result is not None:
+                        self._set_api_result(self._last_result)
 
             return self._last_result
 
-    def _set_api_result(self, result):
+    def _state_changed(self, result):
+        """Is the state of a new `result` different from the last one's?"""
+        last_state = getattr(self._last_result, "state", None)
+        return last_state is None or getattr(result, "state", None) != last_state
+
+    def _adapt_polling_interval(self, state_changed):
+        """Back off while the job's state is unchanged, for `adaptive` polling."""
+        start = 1 if self.polling_interval is None else self.polling_interval
+        if state_changed:
+            self._next_polling_interval = start
+        else:
+            cap = max(_ADAPTIVE_MAX_POLLING_INTERVAL, 8 * start)
+            self._next_polling_interval = min(2 * self._next_polling_interval, cap)
+
+    @property
+    def _civis_state(self):
+        """State as returned from Civis."""
+        result = self._result
+        if result is not None:
+            return result.state
+        cached_time = self._cached_state_time
+        if cached_time is not None and time.monotonic() - cached_time < min(
+            1, self._next_polling_interval / 4
+        ):
+            return self._cached_state
         with self._condition:
-            if result.state in FAILED:
-                try:
-                    err_msg = str(result["error"])
-                except:  # NOQA
-                    err_msg = str(result)
-                job_id = getattr(self, "job_id", None)
-                run_id = getattr(self, "run_id", None)
-                self._set_api_exception(
-                    exc=CivisJobFailure(err_msg, result, job_id, run_id),
-                    result=result,
-                )
-            elif result.state in DONE:
-                self.set_result(result)
-                self.cleanup()
+            state = super()._civis_state
+            self._cached_state = state
+            self._cached_state_time = time.monotonic()
+            return state
+
+    def _set_api_result(self, result):
+        # Called from `_check_result`, which already holds `self._condition`.
+        # `set_result` and `_set_api_exception` take the lock for themselves.
+        self._cached_state_time = None
+        if result.state in FAILED:
+            try:
+                err_msg = str(result["error"])
+            except (KeyError, TypeError):
+                # No error message, or a result that isn't subscriptable.
+                err_msg = str(result)
+            job_id = getattr(self, "job_id", None)
+            run_id = getattr(self, "run_id", None)
+            self._set_api_exception(
+                exc=CivisJobFailure(err_msg, result, job_id, run_id),
+                result=result,
+            )
+        elif result.state in DONE:
+            self.set_result(result)
+            self.cleanup()
 
     def _set_api_exception(self, exc, result=None):
         with self._condition:
+            self._cached_state_time = None
             if result is None:
-                result = Response({"state": FAILED[0]})
+                result = _FAILED_SENTINEL
             self._result = result
             self._last_result = self._result
             self.set_exception(exc)
@@ -216,21 +513,27 @@ class PollableResult(CivisAsyncResultBase):
 
     def cleanup(self):
         # This gets called after the result is set.
-        # Ensure that the polling thread shuts down when it's no longer needed.
+        # Ensure that polling stops when it's no longer needed.
+        self._stop_polling()
+
+    def _stop_polling(self):
         with self._condition:
-            if self._polling_thread.is_alive():
-                self._polling_thread.cancel()
+            token, self._poll_token = self._poll_token, None
+            if token is not None:
+                _POLL_SCHEDULER.unregister(token)
 
-    def _reset_polling_thread(self, polling_interval, start_thread=False):
+    def _reset_polling(self, polling_interval, start_polling=False):
         with self._condition:
-            if (
-                getattr(self, "_polling_thread", None) is not None
-                and self._polling_thread.is_alive()
-            ):
-                self._polling_thread.cancel()
+            self._stop_polling()
+            # Bind the poller to its arguments once rather than on every poll.
+            # Subclasses that change the poller or its arguments
+            # (e.g., to follow a new run) reset polling afterwards.
+            self._invoke = functools.partial(self.poller, *self.poller_args)
+            self._cached_state_time = None
+            self._last_etag = None
+            self._transient_failures = 0
             self.polling_interval = polling_interval
             self._next_polling_interval = 1 if (pi := polling_interval) is None else pi
-            self._use_geometric_polling = polling_interval is None
-            self._polling_thread = _ResultPollingThread(self)
-            if start_thread:
-                self._polling_thread.start()
+            self._use_geometric_polling = polling_interval is None and not self.adaptive
+            if start_polling:
+                self._start_polling()
@@ -48,7 +48,6 @@ def generate_client_pyi(client_pyi_path, api_spec_path):
             """# This file is auto-generated by tools/update_civis_api_spec.py.
 # Do not edit it by hand.
 
-from collections import OrderedDict
 from collections.abc import Iterator
 from typing import Any, List
 
@@ -139,7 +138,7 @@ class APIClient:
         api_key: str | None = ...,
         return_type: str = ...,
         api_version: str = ...,
-        local_api_spec: OrderedDict | str | None = ...,
+        local_api_spec: dict | str | None = ...,
         force_refresh_api_spec: bool = ...,
     ): ...
     def get_aws_credential_id(
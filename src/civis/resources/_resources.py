@@ -1,16 +1,14 @@
-from collections import OrderedDict
 from collections.abc import Iterator
 from functools import lru_cache
 import json
 import os
-import re
 import sys
 import time
 import textwrap
 from inspect import Signature, Parameter
 from typing import List
+from urllib.parse import unquote
 
-from jsonref import JsonRef
 import requests
 from requests import Request
 
@@ -55,8 +53,6 @@ ITERATOR_PARAM_DESC = (
 CACHED_SPEC_PATH = os.path.join(os.path.expanduser("~"), ".civis_api_spec.json")
 DEFAULT_ARG_VALUE = None
 
-_BRACKETED_REGEX = re.compile(r"^{.*}$")
-
 
 def _snake_to_camel(s):
     return "".join(s.title() for s in s.split("_"))
@@ -66,13 +62,36 @@ def exclude_resource(path, api_version):
     # TODO: api_version is not used here.
     #   Dropping it would affect upstream code, including civis.APIClient.
     #   We may need to deprecate api_version in the future.
-    if any(path.startswith(x) for x in RESOURCES_TO_EXCLUDE):
-        return True
-    return False
+    return path.split("/", 1)[0] in RESOURCES_TO_EXCLUDE
+
+
+@lru_cache(maxsize=None)
+def _text_wrapper(indent):
+    return textwrap.TextWrapper(
+        width=79, initial_indent=indent, subsequent_indent=indent
+    )
+
+
+# The same descriptions recur across many endpoints in an API spec
+# (e.g., for shared objects like users and schedules).
+@lru_cache(maxsize=4096)
+def _wrap_doc(text, indent=""):
+    """Equivalent to ``textwrap.fill(text, width=79, ...)`` with ``indent``
+    as both the initial and subsequent indent, reusing one wrapper per indent.
+    Short single-line descriptions are returned without being re-wrapped.
+    """
+    short = len(indent) + len(text) <= 79
+    if text and short and text.isprintable() and text == text.strip():
+        return indent + text
+    return _text_wrapper(indent).fill(text)
 
 
 def get_properties(x):
-    return x.get("properties") or x.get("items", {}).get("properties")
+    properties = x.get("properties")
+    if properties:
+        return properties
+    items = x.get("items")
+    return None if items is None else items.get("properties")
 
 
 def property_type(
@@ -87,17 +106,21 @@ def property_type(
     return "{} ({})".format(t, fmt) if get_format and fmt else t
 
 
-def name_and_type_doc(name, prop, level, optional=False, in_returned_object=False):
+def name_and_type_doc(
+    name, prop, level, optional=False, in_returned_object=False, snake_name=None
+):
     """Create a doc string element that includes a parameter's name
     and its type. This is intended to be combined with another
     doc string element that gives a description of the parameter.
+    Callers that have already snake-cased `name` may pass it as `snake_name`.
     """
     prop_type = (
         "object"
         if name == "value"
         else property_type(prop, in_returned_object=in_returned_object)
     )
-    snake_name = camel_to_snake(name)
+    if snake_name is None:
+        snake_name = camel_to_snake(name)
     indent = " " * level * 4
     dash = "- " if level > 0 else ""
     opt_str = ", optional" if optional else ""
@@ -106,7 +129,13 @@ def name_and_type_doc(name, prop, level, optional=False, in_returned_object=Fals
 
 
 def docs_from_property(
-    name, prop, properties, level, optional=False, in_returned_object=False
+    name,
+    prop,
+    properties,
+    level,
+    optional=False,
+    in_returned_object=False,
+    snake_name=None,
 ):
     """Create a list of doc string elements from a single property
     object. Avoids infinite recursion when a property contains a
@@ -115,17 +144,20 @@ def docs_from_property(
     docs = []
     child_properties = get_properties(prop)
     child = None if child_properties == properties else child_properties
-    docs.append(name_and_type_doc(name, prop, level, optional, in_returned_object))
+    docs.append(
+        name_and_type_doc(
+            name, prop, level, optional, in_returned_object, snake_name=snake_name
+        )
+    )
     doc_str = prop.get("description")
     if doc_str:
         indent = 4 * (level + 1) * " "
-        doc_wrap = textwrap.fill(
-            doc_str, initial_indent=indent, subsequent_indent=indent, width=79
-        )
+        doc_wrap = _wrap_doc(doc_str, indent)
         docs.append(f"{doc_wrap}\n") if child else docs.append(doc_wrap)
     if child:
-        child_docs = docs_from_properties(child, level + 1, in_returned_object)
-        docs.append("\n".join(child_docs))
+        # Keep the child elements separate rather than joining them here,
+        # so that nested properties aren't re-joined at every level.
+        docs.extend(docs_from_properties(child, level + 1, in_returned_object))
     return docs
 
 
@@ -255,22 +287,21 @@ def type_from_param(param, skip_dict_item_type=False, in_returned_object=False):
     return f"{main_type}[{item_type}]" if item_type else main_type
 
 
-def doc_from_param(param):
+def doc_from_param(param, snake_name=None):
     """Return a doc string element for a single parameter.
     Intended to be joined with other doc string elements to
     form a complete docstring of the accepted parameters of
     a function.
     """
-    snake_name = camel_to_snake(param["name"])
+    if snake_name is None:
+        snake_name = camel_to_snake(param["name"])
     param_type = type_from_param(param)
     desc = param.get("description")
     optional = "" if param["required"] else ", optional"
     doc_body = ""
     if desc:
         indent = " " * 4
-        doc_wrap = textwrap.fill(
-            desc, initial_indent=indent, subsequent_indent=indent, width=79
-        )
+        doc_wrap = _wrap_doc(desc, indent)
         doc_body += doc_wrap
         doc_body += "\n"
     doc_head = "{} : {}{}\n".format(snake_name, param_type, optional)
@@ -281,9 +312,12 @@ def iterable_method(method, params):
     """Determine whether it is possible for this endpoint to return an iterated
     response.
     """
-    required_params = ("limit", "page_num")
-    params_present = all(param in params for param in required_params)
-    return method.lower() == "get" and params_present
+    if method.lower() != "get":
+        return False
+    # Materialize the names once, so that a generator isn't consumed
+    # by the first membership test.
+    params = frozenset(params)
+    return "limit" in params and "page_num" in params
 
 
 def create_signature(
@@ -332,6 +366,42 @@ def create_signature(
     return Signature(p, return_annotation=return_annotation)
 
 
+def _shared_signature(args, optional_args):
+    """Return ``create_signature(args, optional_args)``, shared between methods.
+
+    Many endpoints take the same arguments (e.g., a required ``id``),
+    and signatures are immutable, so methods with the same arguments
+    can share one signature.
+    """
+    # The default's type is part of the key so that, e.g., 1 and True
+    # don't share a signature.
+    key = (
+        tuple((name, arg["type"]) for name, arg in args.items()),
+        tuple(
+            (name, type(arg["default"]), arg["default"], arg["type"])
+            for name, arg in optional_args.items()
+        ),
+    )
+    try:
+        hash(key)
+    except TypeError:
+        # An unhashable default value, e.g., a list.
+        return create_signature(args, optional_args)
+    return _signature_from_key(key)
+
+
+@lru_cache(maxsize=1024)
+def _signature_from_key(key):
+    args, optional_args = key
+    return create_signature(
+        {name: {"type": type_} for name, type_ in args},
+        {
+            name: {"default": default, "type": type_}
+            for name, _, default, type_ in optional_args
+        },
+    )
+
+
 def split_method_params(params):
     args = {}
     optional_args = {}
@@ -404,8 +474,17 @@ def create_method(
     )
     elements = split_method_params(params)
     sig_args, sig_opt_args, body_params, query_params, path_params = elements
-    sig = create_signature(sig_args, sig_opt_args)
+    sig = _shared_signature(sig_args, sig_opt_args)
+    arg_names = tuple(sig_args)
     is_iterable = iterable_method(verb, query_params)
+    # Where each argument goes in the API call: 0 for the body,
+    # 1 for the query string, or 2 for the path.
+    destinations = dict.fromkeys(body_params, 0)
+    destinations.update(dict.fromkeys(query_params, 1))
+    destinations.update(dict.fromkeys(path_params, 2))
+    # Bind the path template's formatter once; format_map takes the path
+    # values as they are, without unpacking them into keyword arguments.
+    format_path = path.format_map
 
     def f(self, *args, **kwargs):
         raise_for_unexpected_kwargs(
@@ -413,22 +492,26 @@ def create_method(
         )
 
         iterator = kwargs.pop("iterator", False)
-        arguments = sig.bind(*args, **kwargs).arguments
+        arguments = bind_arguments(arg_names, args, kwargs)
         if arguments.get("kwargs"):
             arguments.update(arguments.pop("kwargs"))
-        body = {x: arguments[x] for x in body_params if x in arguments}
-        query = {x: arguments[x] for x in query_params if x in arguments}
-        path_vals = {x: arguments[x] for x in path_params if x in arguments}
-        url = path.format(**path_vals) if path_vals else path
+        body, query, path_vals = sorted_args = ({}, {}, {})
+        for name, value in arguments.items():
+            destination = destinations.get(name)
+            if destination is not None:
+                sorted_args[destination][name] = value
+        url = format_path(path_vals) if path_vals else path
         return self._call_api(
             verb, url, query, body, deprecation_warning, iterator=iterator
         )
 
-    # Add signature to function, including 'self' for class method
-    sig_self = create_signature(
-        sig_args, sig_opt_args, prepend_self=True, return_annotation=return_annotation
+    # Add signature to function, including 'self' for class method.
+    # Reuse the parameters already built for `sig` rather than creating them again.
+    self_param = Parameter("self", Parameter.POSITIONAL_OR_KEYWORD)
+    f.__signature__ = sig.replace(
+        parameters=[self_param, *sig.parameters.values()],
+        return_annotation=return_annotation,
     )
-    f.__signature__ = sig_self
     f.__doc__ = doc
     f.__name__ = str(method_name)
     return f
@@ -447,8 +530,31 @@ def raise_for_unexpected_kwargs(
         raise TypeError(msg_fmt.format(method_name, str(unexpected)))
 
 
+def bind_arguments(arg_names, args, kwargs):
+    """Map the arguments of a call to a generated method to parameter names.
+
+    This is equivalent to ``create_signature(...).bind(*args, **kwargs).arguments``
+    (with the same error messages) for a method whose required parameters
+    are `arg_names` and whose optional parameters are keyword-only,
+    but avoids the overhead of :meth:`inspect.Signature.bind` on every API call.
+    Unexpected keyword arguments must be checked for separately.
+    """
+    for name in arg_names[: len(args)]:
+        if name in kwargs:
+            raise TypeError(f"multiple values for argument {name!r}")
+    if len(args) > len(arg_names):
+        raise TypeError("too many positional arguments")
+    arguments = dict(zip(arg_names, args))
+    arguments.update(kwargs)
+    for name in arg_names:
+        if name not in arguments:
+            raise TypeError(f"missing a required argument: {name!r}")
+    return arguments
+
+
 def bracketed(x):
-    return _BRACKETED_REGEX.search(x)
+    """Is `x` a path parameter like "{id}"?"""
+    return len(x) > 1 and x[0] == "{" and x[-1] == "}"
 
 
 def parse_param(param):
@@ -463,7 +569,7 @@ def parse_param(param):
     else:
         snake_name = camel_to_snake(param["name"])
         req = param["required"]
-        doc = doc_from_param(param)
+        doc = doc_from_param(param, snake_name)
         a = {
             "name": snake_name,
             "in": param_in,
@@ -484,7 +590,7 @@ def parse_params(parameters, summary, verb):
     args = []
     for param in parameters:
         args.extend(parse_param(param))
-    if iterable_method(verb, (x["name"] for x in args)):
+    if iterable_method(verb, {x["name"] for x in args}):
         iter_arg = {
             "name": "iterator",
             "in": None,
@@ -497,7 +603,7 @@ def parse_params(parameters, summary, verb):
     opt_docs = [x["doc"] for x in args if not x["required"]]
     param_docs = "".join(req_docs + opt_docs)
     if summary:
-        summary_str = "{}\n".format(textwrap.fill(summary, width=79))
+        summary_str = "{}\n".format(_wrap_doc(summary))
     else:
         summary_str = ""
     if param_docs:
@@ -523,7 +629,9 @@ def parse_param_body(parameter):
     for name, prop in properties.items():
         snake_name = camel_to_snake(name)
         is_req = name in req
-        doc_list = docs_from_property(name, prop, properties, 0, not is_req)
+        doc_list = docs_from_property(
+            name, prop, properties, 0, not is_req, snake_name=snake_name
+        )
         doc = "\n".join(doc_list) + "\n"
         a = {
             "name": snake_name,
@@ -584,8 +692,7 @@ def parse_method(verb, operation, path):
         return None
 
     args, param_doc = parse_params(params, summary, verb)
-    elements = split_method_params(params)
-    _, _, _, query_params, _ = elements
+    query_params = {param["name"] for param in params if param["in"] == "query"}
     is_iterable = iterable_method(verb, query_params)
     response_doc = doc_from_responses(responses, is_iterable)
     name = parse_method_name(verb, path)
@@ -633,31 +740,85 @@ def parse_api_spec(api_spec, api_version):
 
     Parameters
     ----------
-    api_spec : OrderedDict
+    api_spec : dict
         The Civis API specification to parse.  References should be resolved
-        before passing, typically using jsonref.JsonRef().
+        before passing, typically using :func:`resolve_refs`.
     api_version : string, optional
         The version of endpoints to call. May instantiate multiple client
         objects with different versions.  Currently only "1.0" is supported.
     """
     paths = api_spec["paths"]
-    classes = {}
+    # Collect each endpoint's methods first and create its class once,
+    # rather than setting the methods on the class one at a time.
+    namespaces = {}
     for path, ops in paths.items():
         base_path, methods = parse_path(path, ops, api_version)
-        class_name = base_path.title()
-        if methods and classes.get(base_path) is None:
-            cls = type(class_name, (Endpoint,), {})
-            cls.__doc__ = (
-                "Examples\n"
-                "--------\n"
-                ">>> import civis\n"
-                ">>> client = civis.APIClient()\n"
-                f">>> client.{base_path}.{methods[0][0]}(...)"
-            )
-            classes[base_path] = cls
-        for method_name, method in methods:
-            setattr(classes[base_path], method_name, method)
-    return classes
+        if not methods:
+            continue
+        if base_path not in namespaces:
+            namespaces[base_path] = {
+                "__doc__": (
+                    "Examples\n"
+                    "--------\n"
+                    ">>> import civis\n"
+                    ">>> client = civis.APIClient()\n"
+                    f">>> client.{base_path}.{methods[0][0]}(...)"
+                )
+            }
+        namespaces[base_path].update(methods)
+    return {
+        base_path: type(base_path.title(), (Endpoint,), namespace)
+        for base_path, namespace in namespaces.items()
+    }
+
+
+def resolve_refs(spec):
+    """Return a copy of an API spec with its JSON references resolved.
+
+    Every ``{"$ref": "#/..."}`` object is replaced by the object it points to.
+    All references to the same target share one resolved object, so circular
+    references become cycles in the returned structure. References outside
+    the spec itself are left as they are.
+
+    Parameters
+    ----------
+    spec : dict
+        The API specification, e.g., as loaded from JSON.
+        It isn't modified.
+
+    Returns
+    -------
+    dict
+    """
+    resolved = {}
+
+    def _target(ref):
+        if ref not in resolved:
+            obj = spec
+            for token in ref[1:].split("/")[1:]:
+                token = unquote(token).replace("~1", "/").replace("~0", "~")
+                obj = obj[int(token) if isinstance(obj, list) else token]
+            # `_copy` records the copy in `resolved` before copying its children,
+            # so that a reference back to `ref` from within it finds the copy.
+            resolved[ref] = _copy(obj, ref)
+        return resolved[ref]
+
+    def _copy(obj, ref=None):
+        if isinstance(obj, dict):
+            target = obj.get("$ref")
+            if isinstance(target, str) and target.startswith("#"):
+                return _target(target)
+            copied = type(obj)()
+            if ref is not None:
+                resolved[ref] = copied
+            for key, value in obj.items():
+                copied[key] = _copy(value)
+            return copied
+        elif isinstance(obj, list):
+            return [_copy(value) for value in obj]
+        return obj
+
+    return _copy(spec)
 
 
 def get_api_spec(api_key, api_version="1.0", user_agent="civis-python"):
@@ -686,7 +847,7 @@ def get_api_spec(api_key, api_version="1.0", user_agent="civis-python"):
         msg = "{} error downloading API specification. API key may be expired."
         raise requests.exceptions.HTTPError(msg.format(response.status_code))
     response.raise_for_status()
-    spec = response.json(object_pairs_hook=OrderedDict)
+    spec = response.json()
     return spec
 
 
@@ -743,7 +904,7 @@ def generate_classes(api_key, api_version="1.0"):
             f"{api_version}"
         )
     raw_spec = get_api_spec(api_key, api_version)
-    spec = JsonRef.replace_refs(raw_spec)
+    spec = resolve_refs(raw_spec)
     return parse_api_spec(spec, api_version)
 
 
@@ -784,14 +945,31 @@ def generate_classes_maybe_cached(
     if cache is None:
         classes = generate_classes_ttl_cache(api_key, api_version, _get_ttl_hash())
     else:
-        if isinstance(cache, OrderedDict):
+        if isinstance(cache, dict):
             raw_spec = cache
         elif isinstance(cache, str):
-            with open(cache, "r") as f:
-                raw_spec = json.load(f, object_pairs_hook=OrderedDict)
+            # Key on the file's modification time and size as well,
+            # so that an updated spec file isn't served from the cache.
+            stat = os.stat(cache)
+            return _generate_classes_from_file(
+                os.path.abspath(cache), stat.st_mtime_ns, stat.st_size, api_version
+            )
         else:
-            msg = "cache must be an OrderedDict or str, given {}"
+            msg = "cache must be a dict or str, given {}"
             raise ValueError(msg.format(type(cache)))
-        spec = JsonRef.replace_refs(raw_spec)
+        spec = resolve_refs(raw_spec)
         classes = parse_api_spec(spec, api_version)
     return classes
+
+
+@lru_cache(maxsize=4)
+def _generate_classes_from_file(path, mtime_ns, size, api_version):
+    """Generate class objects from an API spec file.
+
+    Parsing a spec is slow, so the classes are cached for each version
+    of the file (as identified by its modification time and size).
+    """
+    with open(path, "r") as f:
+        raw_spec = json.load(f)
+    spec = resolve_refs(raw_spec)
+    return parse_api_spec(spec, api_version)
@@ -1,3 +1,4 @@
+import concurrent.futures
 import json
 import pprint
 
@@ -55,6 +56,17 @@ def _response_to_json(response):
             raise CivisClientError("Unable to parse JSON from response", response)
 
 
+def _parse_rate_limits(headers):
+    """Return the API calls remaining and the rate limit from response headers."""
+    if not headers:
+        return None, None
+    remaining = headers.get("X-RateLimit-Remaining")
+    limit = headers.get("X-RateLimit-Limit")
+    return (int(remaining) if remaining else remaining), (
+        int(limit) if limit else limit
+    )
+
+
 def convert_response_data_type(
     response, headers=None, return_type="snake", from_json_values=False
 ):
@@ -90,8 +102,15 @@ def convert_response_data_type(
             data = response
 
         if isinstance(data, list):
+            # All the items share the headers, so parse the rate limits once.
+            rate_limits = _parse_rate_limits(headers)
             return [
-                Response(d, headers=headers, from_json_values=from_json_values)
+                Response(
+                    d,
+                    headers=headers,
+                    from_json_values=from_json_values,
+                    _rate_limits=rate_limits,
+                )
                 for d in data
             ]
         else:
@@ -125,24 +144,49 @@ class Response:
         Total number of calls per API rate limit period.
     """
 
+    # Listing endpoints create a Response for every record,
+    # so don't give each of them an instance dict.
+    __slots__ = (
+        "json_data",
+        "headers",
+        "calls_remaining",
+        "rate_limit",
+        "_data_snake",
+        "_unwrapped",
+    )
+
     def __init__(
-        self, json_data, *, headers=None, snake_case=True, from_json_values=False
+        self,
+        json_data,
+        *,
+        headers=None,
+        snake_case=True,
+        from_json_values=False,
+        _rate_limits=None,
     ):
         self.json_data = json_data
         self.headers = headers
-        self.calls_remaining = (
-            int(x) if (x := (headers or {}).get("X-RateLimit-Remaining")) else x
-        )
-        self.rate_limit = (
-            int(x) if (x := (headers or {}).get("X-RateLimit-Limit")) else x
-        )
-
-        # Note that these two dicts can have Response objects as values.
-        self._data_camel = {}
-        self._data_snake = {}
+        # `_rate_limits` lets callers that create many responses from the same
+        # headers parse them only once.
+        if _rate_limits is None:
+            _rate_limits = _parse_rate_limits(headers)
+        self.calls_remaining, self.rate_limit = _rate_limits
+
+        # Note that this dict can have Response objects as values.
+        # Lookups by the original (camelCase) keys go through `json_data`,
+        # so the values aren't stored a second time under those keys.
+        self._data_snake = data = {}
+        # Nested dicts and lists are only wrapped as Response objects when
+        # first accessed, since callers often read just a few fields.
+        # This maps the keys of values not yet wrapped to whether
+        # their keys should be snake_cased.
+        self._unwrapped = None
 
         if json_data is not None:
+            unwrapped = None
             for key, v in json_data.items():
+                key_snake = camel_to_snake(key) if snake_case else key
+                data[key_snake] = v
 
                 if key == "value" and (
                     from_json_values or json_data.get("objectType") == "JSONValue"
@@ -150,21 +194,36 @@ class Response:
                     # When json_data represents a JSONValue (either from one of the
                     # methods under the `json_values` endpoint or from a script's run
                     # output), `v` is the deserialized JSON.
-                    val = v
-                elif isinstance(v, dict):
-                    if key in _RESPONSE_KEYS_PRESERVE_CASE:
-                        val = Response(v, snake_case=False)
-                    else:
-                        val = Response(v)
-                elif isinstance(v, list):
-                    val = [Response(o) if isinstance(o, dict) else o for o in v]
-                else:
-                    val = v
-
-                key_snake = camel_to_snake(key) if snake_case else key
-
-                self._data_camel[key] = val
-                self._data_snake[key_snake] = val
+                    continue
+                elif isinstance(v, (dict, list)):
+                    if unwrapped is None:
+                        unwrapped = {}
+                    unwrapped[key_snake] = key not in _RESPONSE_KEYS_PRESERVE_CASE
+            self._unwrapped = unwrapped
+
+    def _wrap(self, key):
+        """Wrap the nested dict or list at `key` as Response objects."""
+        snake_case = self._unwrapped.get(key)
+        v = self._data_snake[key]
+        if snake_case is None:
+            # Already wrapped, e.g., by another thread.
+            return v
+        if isinstance(v, dict):
+            val = Response(v, snake_case=snake_case)
+        elif isinstance(v, list):
+            val = [Response(o) if isinstance(o, dict) else o for o in v]
+        else:
+            val = v
+        self._data_snake[key] = val
+        self._unwrapped.pop(key, None)
+        return val
+
+    def _data(self):
+        """Return the data dict, with all nested values wrapped."""
+        if self._unwrapped:
+            for key in list(self._unwrapped):
+                self._wrap(key)
+        return self._data_snake
 
     def json(self, snake_case=True):
         """Return the JSON data.
@@ -188,7 +247,7 @@ class Response:
 
     def _to_dict_with_snake_case_keys(self):
         result = {}
-        for k, v in self._data_snake.items():
+        for k, v in self._data().items():
             if isinstance(v, list):
                 result[k] = [
                     o._to_dict_with_snake_case_keys() if isinstance(o, Response) else o
@@ -201,17 +260,8 @@ class Response:
         return result
 
     def __setattr__(self, key, value):
-        if key == "__dict__":
-            self.__dict__.update(value)
-        elif key in (
-            "json_data",
-            "headers",
-            "calls_remaining",
-            "rate_limit",
-            "_data_camel",
-            "_data_snake",
-        ):
-            self.__dict__[key] = value
+        if key in Response.__slots__:
+            object.__setattr__(self, key, value)
         else:
             _raise_response_immutable_error()
 
@@ -219,10 +269,13 @@ class Response:
         _raise_response_immutable_error()
 
     def __getitem__(self, item):
-        try:
-            return self._data_snake[item]
-        except KeyError:
-            return self._data_camel[item]
+        if item not in self._data_snake:
+            if self.json_data is None or item not in self.json_data:
+                raise KeyError(item)
+            item = camel_to_snake(item)
+        if self._unwrapped and item in self._unwrapped:
+            return self._wrap(item)
+        return self._data_snake[item]
 
     def __getattr__(self, item):
         try:
@@ -234,7 +287,7 @@ class Response:
         return len(self._data_snake)
 
     def __repr__(self):
-        return f"Response({repr(self._data_snake)})"
+        return f"Response({repr(self._data())})"
 
     def __hash__(self):
         return hash(json.dumps(self.json_data))
@@ -258,19 +311,29 @@ class Response:
 
     def items(self):
         """Return an iterator of the key-value pairs in the response."""
-        return self._data_snake.items()
+        return self._data().items()
 
     def __eq__(self, other):
-        if isinstance(other, dict):
-            return self._data_snake == other
+        if self is other:
+            return True
         elif isinstance(other, Response):
-            return self._data_snake == other._data_snake
+            return self._data() == other._data()
+        elif isinstance(other, dict):
+            return self._data() == other
         else:
-            return False
+            # Let the other object decide, e.g., `mock.ANY`.
+            return NotImplemented
+
+    def __getstate__(self):
+        return {name: getattr(self, name) for name in Response.__slots__}
 
     def __setstate__(self, state):
         """Set the state when unpickling, to avoid RecursionError."""
-        self.__dict__ = state
+        # Responses pickled before `__slots__` was added may have
+        # other entries in their state (e.g., "_data_camel"),
+        # and have all their nested values wrapped already.
+        for name in Response.__slots__:
+            object.__setattr__(self, name, state.get(name))
 
 
 class _safe_key:
@@ -315,7 +378,7 @@ def _pprint_response(self, object, stream, indent, allowance, context, level):
     https://github.com/python/cpython/blob/3.7/Lib/pprint.py#L180-L192
     """
     write = stream.write
-    object = object._data_snake
+    object = object._data()
     write("Response({")
     if self._indent_per_level > 1:
         write((self._indent_per_level - 1) * " ")
@@ -354,6 +417,10 @@ class PaginatedResponse:
     This response is returned automatically by endpoints which support
     pagination when the `iterator` kwarg is specified.
 
+    No request is made until the first item is requested. After that, the
+    next page is requested in a background thread while the current page
+    is being iterated over.
+
     Examples
     --------
     >>> import civis
@@ -377,22 +444,63 @@ class PaginatedResponse:
         return self
 
     def _get_iter(self):
-        while True:
-            response = self._endpoint._make_request("GET", self._path, self._params)
-            page_data = _response_to_json(response)
-            if len(page_data) == 0:
-                return
-
-            for data in page_data:
-                converted_data = convert_response_data_type(
-                    data,
-                    headers=response.headers,
-                    return_type=self._endpoint._return_type,
-                    from_json_values=(self._path or "").startswith("json_values"),
+        from_json_values = (self._path or "").startswith("json_values")
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="civis-pagination"
+        )
+        try:
+            response = self._endpoint._make_request(
+                "GET", self._path, dict(self._params)
+            )
+            while True:
+                page_data = _response_to_json(response)
+                if len(page_data) == 0:
+                    return
+                # Only the headers are needed from here on. Drop the raw
+                # response so its body can be freed while the page is iterated.
+                headers = response.headers
+                del response
+                self._params["page_num"] += 1
+                # Fetch the next page while the caller works through this one.
+                next_response = executor.submit(
+                    self._endpoint._make_request, "GET", self._path, dict(self._params)
+                )
+                yield from self._convert_page(headers, page_data, from_json_values)
+                response = next_response.result()
+                del next_response
+        finally:
+            # Don't wait for a prefetch that an abandoned iterator won't use.
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _convert_page(self, headers, page_data, from_json_values):
+        # Items are popped off the page as they're yielded, so a raw item
+        # can be freed once the caller is done with its converted object.
+        # `page_data` is emptied in the process.
+        page_data.reverse()
+        return_type = self._endpoint._return_type
+        if return_type == "snake":
+            # Every item on a page shares the page's headers.
+            rate_limits = _parse_rate_limits(headers)
+            while page_data:
+                yield Response(
+                    page_data.pop(),
+                    headers=headers,
+                    from_json_values=from_json_values,
+                    _rate_limits=rate_limits,
+                )
+        elif return_type == "raw":
+            # Items are yielded as they are, without going through
+            # `convert_response_data_type` for each one.
+            while page_data:
+                yield page_data.pop()
+        else:
+            while page_data:
+                yield convert_response_data_type(
+                    page_data.pop(),
+                    headers=headers,
+                    return_type=return_type,
+                    from_json_values=from_json_values,
                 )
-                yield converted_data
-
-            self._params["page_num"] += 1
 
     def __next__(self):
         if self._iter is None:
@@ -9,10 +9,10 @@ will be set as an output on this run.
 """
 
 from datetime import datetime, timedelta
-from io import BytesIO
 import os
 import pickle  # nosec
 import sys
+from tempfile import TemporaryDirectory
 
 import civis
 import cloudpickle
@@ -54,18 +54,23 @@ def worker_func(func_file_id):
         # Serialize the result and upload it to the Files API.
         if result is not None:
             # If the function exits without erroring, we may not have a result.
-            result_buffer = BytesIO()
-            cloudpickle.dump(result, result_buffer, pickle.HIGHEST_PROTOCOL)
-            result_buffer.seek(0)
+            # Serialize to a temporary file rather than an in-memory buffer,
+            # so a large result isn't held in memory a second time, and
+            # it can be uploaded in parts.
             output_name = "Results from Joblib job {} / run {}".format(job_id, run_id)
-            output_file_id = _robust_file_to_civis(
-                result_buffer,
-                output_name,
-                n_retries=5,
-                delay=0.5,
-                expires_at=expires_at,
-                client=client,
-            )
+            with TemporaryDirectory() as tempdir:
+                temppath = os.path.join(tempdir, "civis_joblib_result")
+                with open(temppath, "wb") as tmpfile:
+                    cloudpickle.dump(result, tmpfile, pickle.HIGHEST_PROTOCOL)
+                with open(temppath, "rb") as tmpfile:
+                    output_file_id = _robust_file_to_civis(
+                        tmpfile,
+                        output_name,
+                        n_retries=5,
+                        delay=0.5,
+                        expires_at=expires_at,
+                        client=client,
+                    )
             client.scripts.post_containers_runs_outputs(
                 job_id, run_id, "File", output_file_id
             )
@@ -1,13 +1,12 @@
-from collections import OrderedDict
-from functools import lru_cache
 import json
-from jsonref import JsonRef
 import re
+import threading
+
 import requests
 
 from civis import APIClient
 from civis.base import CivisAPIError, Endpoint, tostr_urljoin
-from civis.resources._resources import parse_method
+from civis.resources._resources import parse_method, resolve_refs
 
 
 _TO_CAMELCASE_REGEX = re.compile(r"(^|_)([a-zA-Z])")
@@ -22,13 +21,45 @@ def _get_service(client):
     return service
 
 
-def auth_service_session(session, client):
-    service = _get_service(client)
-    auth_url = service["current_deployment"]["displayUrl"]
+def auth_service_session(session, client, refresh_service=False):
+    # The service is looked up once per client. Look it up again if asked,
+    # e.g., when the service may have been redeployed.
+    if refresh_service or client._service is None:
+        client._service = _get_service(client)
+    auth_url = client._service["current_deployment"]["displayUrl"]
     # Make request for adding Authentication Cookie to session
     session.get(auth_url)
 
 
+# Classes generated from the API spec of each service deployment, keyed by
+# (service ID, deployment ID, swagger path, root path). A deployment serves
+# the same spec to every client, so clients share the classes.
+_DEPLOYMENT_CLASSES = {}
+_DEPLOYMENT_CLASSES_LOCK = threading.Lock()
+_MAX_CACHED_DEPLOYMENTS = 4
+
+
+def _get_deployment_classes(key, generate_classes):
+    """Return the classes cached for `key`, calling `generate_classes` if needed.
+
+    The classes are generated without holding the lock, so that a slow spec
+    download doesn't hold up clients of other services. If two clients of a
+    deployment race, both get the classes that were cached first.
+    """
+    with _DEPLOYMENT_CLASSES_LOCK:
+        classes = _DEPLOYMENT_CLASSES.get(key)
+    if classes is not None:
+        return classes
+    classes = generate_classes()
+    with _DEPLOYMENT_CLASSES_LOCK:
+        if key not in _DEPLOYMENT_CLASSES:
+            if len(_DEPLOYMENT_CLASSES) >= _MAX_CACHED_DEPLOYMENTS:
+                # Evict the oldest entry.
+                del _DEPLOYMENT_CLASSES[next(iter(_DEPLOYMENT_CLASSES))]
+            _DEPLOYMENT_CLASSES[key] = classes
+        return _DEPLOYMENT_CLASSES[key]
+
+
 def _parse_service_path(path, operations, root_path=None):
     """Parse an endpoint into a class where each valid http request
     on that endpoint is converted into a convenience function and
@@ -56,9 +87,10 @@ def parse_service_api_spec(api_spec, root_path=None):
 
     Parameters
     ----------
-    api_spec : OrderedDict
+    api_spec : dict
         The Civis Service API specification to parse.  References should be
-        resolved before passing, typically using jsonref.JsonRef().
+        resolved before passing, typically using
+        :func:`civis.resources._resources.resolve_refs`.
     root_path : str, optional
         An additional path for APIs that are not hosted on the service's
         root level. An example root_path would be '/api' for an app with
@@ -81,6 +113,9 @@ class ServiceEndpoint(Endpoint):
     def __init__(self, client, return_type="civis"):
         self._return_type = return_type
         self._client = client
+        # An authenticated session, created on the first request.
+        self._session = None
+        self._session_lock = threading.Lock()
 
     def _build_path(self, path):
         if not path:
@@ -91,11 +126,36 @@ class ServiceEndpoint(Endpoint):
             self._client._base_url, self._client._root_path.strip("/"), path.strip("/")
         )
 
+    def _get_session(self, stale=None):
+        """Return a session authenticated with the service.
+
+        The session is reused across requests, so that each request doesn't
+        cost an extra round trip to authenticate (and a new connection).
+        If `stale` is still the current session, e.g., because a request
+        with it got a 401, it's replaced with a newly authenticated one.
+        Comparing sessions means that when several threads get a 401 at once,
+        only the first one authenticates again.
+        """
+        with self._session_lock:
+            if self._session is None or self._session is stale:
+                session = requests.Session()
+                auth_service_session(
+                    session, self._client, refresh_service=stale is not None
+                )
+                # Another thread may still be using the old session,
+                # so leave it to be closed when it's garbage-collected.
+                self._session = session
+            return self._session
+
     def _make_request(self, method, path=None, params=None, data=None, **kwargs):
         url = self._build_path(path)
 
-        with requests.Session() as sess:
-            auth_service_session(sess, self._client)
+        sess = self._get_session()
+        with self._lock:
+            response = sess.request(method, url, json=data, params=params, **kwargs)
+        if response.status_code == 401:
+            # The authentication may have expired, so authenticate again.
+            sess = self._get_session(stale=sess)
             with self._lock:
                 response = sess.request(method, url, json=data, params=params, **kwargs)
 
@@ -144,19 +204,21 @@ class ServiceClient:
             - ``'snake'`` Returns a :class:`civis.Response` object
             for the json-encoded content of a response. This maps the
             top-level json keys to snake_case.
-        local_api_spec : collections.OrderedDict or string, optional
+        local_api_spec : dict or string, optional
             The methods on this class are dynamically built from the Service
             API specification, which can be retrieved from the /endpoints
             endpoint. When local_api_spec is None, the default, this
             specification is downloaded the first time APIClient is
             instantiated. Alternatively, a local cache of the specification
-            may be passed as either an OrderedDict or a filename which
+            may be passed as either a dict or a filename which
             points to a json file.
         """
         if return_type not in ["snake", "raw"]:
             raise ValueError("Return type must be one of 'snake', 'raw'")
         self._api_key = api_key
         self._service_id = service_id
+        # The Civis service, looked up by `get_base_url`.
+        self._service = None
         self._base_url = self.get_base_url()
         self._root_path = root_path
         self._swagger_path = swagger_path
@@ -164,7 +226,6 @@ class ServiceClient:
         for class_name, klass in classes.items():
             setattr(self, class_name, klass(client=self, return_type=return_type))
 
-    @lru_cache(maxsize=4)
     def get_api_spec(self):
         swagger_url = self._base_url + self._swagger_path
 
@@ -172,33 +233,41 @@ class ServiceClient:
             auth_service_session(sess, self)
             response = sess.get(swagger_url)
             response.raise_for_status()
-        spec = response.json(object_pairs_hook=OrderedDict)
+        spec = response.json()
         return spec
 
-    @lru_cache(maxsize=4)
     def generate_classes(self):
         raw_spec = self.get_api_spec()
-        spec = JsonRef.replace_refs(raw_spec)
+        spec = resolve_refs(raw_spec)
         return parse_service_api_spec(spec, root_path=self._root_path)
 
     def get_base_url(self):
-        service = _get_service(self)
-        return service["current_url"]
+        self._service = _get_service(self)
+        return self._service["current_url"]
 
     def generate_classes_maybe_cached(self, cache):
         """Generate class objects either from /endpoints or a local cache."""
         if cache is None:
-            classes = self.generate_classes()
+            if self._service is None:
+                # The deployment is unknown, so there's nothing to cache by.
+                return self.generate_classes()
+            key = (
+                self._service_id,
+                self._service["current_deployment"]["deployment_id"],
+                self._swagger_path,
+                self._root_path,
+            )
+            classes = _get_deployment_classes(key, self.generate_classes)
         else:
-            if isinstance(cache, OrderedDict):
+            if isinstance(cache, dict):
                 raw_spec = cache
             elif isinstance(cache, str):
                 with open(cache, "r") as f:
-                    raw_spec = json.load(f, object_pairs_hook=OrderedDict)
+                    raw_spec = json.load(f)
             else:
-                msg = "cache must be an OrderedDict or str, given {}"
+                msg = "cache must be a dict or str, given {}"
                 raise ValueError(msg.format(type(cache)))
-            spec = JsonRef.replace_refs(raw_spec)
+            spec = resolve_refs(raw_spec)
             classes = parse_service_api_spec(spec, root_path=self._root_path)
         return classes
 
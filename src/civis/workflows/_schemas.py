@@ -9,17 +9,22 @@ https://docs.openstack.org/mistral/latest/user/wf_lang_v2.html#workflows
 
 from __future__ import annotations
 
+import functools
 import inspect
 
 from civis import APIClient
 from civis.resources import API_SPEC_PATH
 
 
-_CLIENT = APIClient(local_api_spec=API_SPEC_PATH, api_key="no-key-needed")
+@functools.lru_cache(maxsize=None)
+def _client() -> APIClient:
+    # Building a client parses the bundled API spec, which is slow,
+    # so wait until a schema that needs it is first requested.
+    return APIClient(local_api_spec=API_SPEC_PATH, api_key="no-key-needed")
 
 
 def _endpoint_method_params(endpoint: str, method: str) -> tuple[list[str], list[str]]:
-    endpt = getattr(_CLIENT, endpoint)
+    endpt = getattr(_client(), endpoint)
     meth = getattr(endpt, method)
     method_params = inspect.signature(meth).parameters
     required, optional = [], []
@@ -142,130 +147,146 @@ TASK_TRANSITION_SCHEMA = {
     ],
 }
 
-TASK_SCHEMA = {
-    "$schema": "https://json-schema.org/draft/2020-12/schema",
-    "type": "object",
-    "properties": {
-        "name": {
-            "type": "string",
-            "maxLength": 255,
-            "not": {"enum": ["noop", "fail", "succeed", "pause"]},
-        },
-        "description": {"type": "string"},
-        "action": {
-            "type": "string",
-            "enum": [
-                "civis.scripts.python3",
-                "civis.scripts.r",
-                "civis.scripts.sql",
-                "civis.scripts.javascript",
-                "civis.scripts.container",
-                "civis.scripts.dbt",
-                "civis.scripts.custom",
-                "civis.enhancements.cass_ncoa",
-                "civis.import",
-                "civis.run_job",
-                "civis.workflows.execute",
-                "std.async_noop",
-                "std.echo",
-                "std.fail",
-                "std.noop",
-            ],
-        },
-        "input": {"type": "object"},
-        "publish": {"type": "object"},
-        "publish-on-error": {"type": "object"},
-        "on-success": TASK_TRANSITION_SCHEMA,
-        "on-error": TASK_TRANSITION_SCHEMA,
-        "on-complete": TASK_TRANSITION_SCHEMA,
-        "join": {
-            "oneOf": [
-                {"const": "all"},
-                {"type": "integer", "minimum": 1},
-            ],
-        },
-        "requires": {"type": "array"},
-        "with-items": {
-            "oneOf": [
-                {"type": "string"},
-                {"type": "array", "items": {"type": "string"}},
-            ],
-        },
-        "keep-result": {"type": "boolean"},
-        "target": {"type": "string"},
-        "pause-before": {"type": "boolean"},
-        "wait-before": {"type": "number", "minimum": 0},
-        "wait-after": {"type": "number", "minimum": 0},
-        "fail-on": {"type": "string"},
-        "timeout": {"type": "number", "minimum": 0},
-        "retry": {
-            "oneOf": [
-                {"type": "string"},
-                {
-                    "type": "object",
-                    "properties": {
-                        "count": {"type": "number", "minimum": 0},
-                        "delay": {"type": "number", "minimum": 0},
-                        "break-on": {"type": "string"},
-                        "continue-on": {"type": "string"},
+
+@functools.lru_cache(maxsize=None)
+def _task_schema() -> dict:
+    return {
+        "$schema": "https://json-schema.org/draft/2020-12/schema",
+        "type": "object",
+        "properties": {
+            "name": {
+                "type": "string",
+                "maxLength": 255,
+                "not": {"enum": ["noop", "fail", "succeed", "pause"]},
+            },
+            "description": {"type": "string"},
+            "action": {
+                "type": "string",
+                "enum": [
+                    "civis.scripts.python3",
+                    "civis.scripts.r",
+                    "civis.scripts.sql",
+                    "civis.scripts.javascript",
+                    "civis.scripts.container",
+                    "civis.scripts.dbt",
+                    "civis.scripts.custom",
+                    "civis.enhancements.cass_ncoa",
+                    "civis.import",
+                    "civis.run_job",
+                    "civis.workflows.execute",
+                    "std.async_noop",
+                    "std.echo",
+                    "std.fail",
+                    "std.noop",
+                ],
+            },
+            "input": {"type": "object"},
+            "publish": {"type": "object"},
+            "publish-on-error": {"type": "object"},
+            "on-success": TASK_TRANSITION_SCHEMA,
+            "on-error": TASK_TRANSITION_SCHEMA,
+            "on-complete": TASK_TRANSITION_SCHEMA,
+            "join": {
+                "oneOf": [
+                    {"const": "all"},
+                    {"type": "integer", "minimum": 1},
+                ],
+            },
+            "requires": {"type": "array"},
+            "with-items": {
+                "oneOf": [
+                    {"type": "string"},
+                    {"type": "array", "items": {"type": "string"}},
+                ],
+            },
+            "keep-result": {"type": "boolean"},
+            "target": {"type": "string"},
+            "pause-before": {"type": "boolean"},
+            "wait-before": {"type": "number", "minimum": 0},
+            "wait-after": {"type": "number", "minimum": 0},
+            "fail-on": {"type": "string"},
+            "timeout": {"type": "number", "minimum": 0},
+            "retry": {
+                "oneOf": [
+                    {"type": "string"},
+                    {
+                        "type": "object",
+                        "properties": {
+                            "count": {"type": "number", "minimum": 0},
+                            "delay": {"type": "number", "minimum": 0},
+                            "break-on": {"type": "string"},
+                            "continue-on": {"type": "string"},
+                        },
                     },
-                },
-            ],
+                ],
+            },
+            "concurrency": {"type": "number", "minimum": 1},
+            "safe-rerun": {"type": "boolean"},
         },
-        "concurrency": {"type": "number", "minimum": 1},
-        "safe-rerun": {"type": "boolean"},
-    },
-    "required": ["action"],
-    "allOf": [
-        # If "action" is one of the Civis-defined ones,
-        # then the allowed properties under "input" closely mirror the relevant
-        # API endpoint method.
-        _if_then_create_script("civis.scripts.python3"),
-        _if_then_create_script("civis.scripts.r"),
-        _if_then_create_script("civis.scripts.sql"),
-        _if_then_create_script("civis.scripts.javascript"),
-        _if_then_create_script("civis.scripts.container"),
-        _if_then_create_script("civis.scripts.dbt"),
-        _if_then_create_script("civis.scripts.custom"),
-        _if_then_create_script("civis.enhancements.cass_ncoa"),
-        _if_then_execute("civis.run_job", "job_id"),
-        _if_then_execute("civis.workflows.execute", "workflow_id"),
-        _if_then_import(),
-    ],
-    "additionalProperties": False,
-}
+        "required": ["action"],
+        "allOf": [
+            # If "action" is one of the Civis-defined ones,
+            # then the allowed properties under "input" closely mirror the relevant
+            # API endpoint method.
+            _if_then_create_script("civis.scripts.python3"),
+            _if_then_create_script("civis.scripts.r"),
+            _if_then_create_script("civis.scripts.sql"),
+            _if_then_create_script("civis.scripts.javascript"),
+            _if_then_create_script("civis.scripts.container"),
+            _if_then_create_script("civis.scripts.dbt"),
+            _if_then_create_script("civis.scripts.custom"),
+            _if_then_create_script("civis.enhancements.cass_ncoa"),
+            _if_then_execute("civis.run_job", "job_id"),
+            _if_then_execute("civis.workflows.execute", "workflow_id"),
+            _if_then_import(),
+        ],
+        "additionalProperties": False,
+    }
 
 
-WORKFLOW_SCHEMA = {
-    "$schema": "https://json-schema.org/draft/2020-12/schema",
-    "type": "object",
-    "properties": {"version": {"const": "2.0"}},
-    "patternProperties": {
-        "^(?:(?!version).)*$": {
-            "type": "object",
-            "properties": {
-                "type": {"type": "string"},
-                "description": {"type": "string"},
-                "input": {
-                    "type": "array",
-                    "items": {"oneOf": [{"type": "string"}, {"type": "object"}]},
-                },
-                "output": {},
-                "output-on-error": {},
-                "task-defaults": {
-                    k: v for k, v in TASK_SCHEMA.items() if k != "required"
-                },
-                "tasks": {
-                    "type": "object",
-                    "patternProperties": {"^.*$": TASK_SCHEMA},
-                    "minProperties": 1,
+@functools.lru_cache(maxsize=None)
+def _workflow_schema() -> dict:
+    task_schema = _task_schema()
+    return {
+        "$schema": "https://json-schema.org/draft/2020-12/schema",
+        "type": "object",
+        "properties": {"version": {"const": "2.0"}},
+        "patternProperties": {
+            "^(?:(?!version).)*$": {
+                "type": "object",
+                "properties": {
+                    "type": {"type": "string"},
+                    "description": {"type": "string"},
+                    "input": {
+                        "type": "array",
+                        "items": {"oneOf": [{"type": "string"}, {"type": "object"}]},
+                    },
+                    "output": {},
+                    "output-on-error": {},
+                    "task-defaults": {
+                        k: v for k, v in task_schema.items() if k != "required"
+                    },
+                    "tasks": {
+                        "type": "object",
+                        "patternProperties": {"^.*$": task_schema},
+                        "minProperties": 1,
+                    },
                 },
+                "required": ["tasks"],
+                "additionalProperties": True,  # Allow anchor definitions.
             },
-            "required": ["tasks"],
-            "additionalProperties": True,  # Allow anchor definitions.
         },
-    },
-    "required": ["version"],
-    "minProperties": 2,
-    "maxProperties": 2,
-}
+        "required": ["version"],
+        "minProperties": 2,
+        "maxProperties": 2,
+    }
+
+
+def __getattr__(name: str):
+    # The task and workflow schemas are built on first access (PEP 562),
+    # so that importing this module doesn't parse the API spec.
+    if name == "TASK_SCHEMA":
+        return _task_schema()
+    elif name == "WORKFLOW_SCHEMA":
+        return _workflow_schema()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -7,7 +7,7 @@ import io
 import jsonschema
 import yaml
 
-from ._schemas import WORKFLOW_SCHEMA
+from . import _schemas
 
 
 _TASK_TRANSITION_ENGINE_COMMANDS = frozenset(["pause", "succeed", "fail"])
@@ -38,7 +38,7 @@ def validate_workflow_yaml(wf_def: str, /) -> None:
 
 def _validate_workflow_by_schema(wf: dict) -> None:
     try:
-        jsonschema.validate(wf, WORKFLOW_SCHEMA)
+        jsonschema.validate(wf, _schemas.WORKFLOW_SCHEMA)
     except jsonschema.ValidationError as e:
         raise WorkflowValidationError(e)
 
@@ -4,7 +4,7 @@ from json.decoder import JSONDecodeError
 import pytest
 import requests
 
-from civis.base import Endpoint, get_base_url, CivisAPIError
+from civis.base import Endpoint, get_base_url, CivisAPIError, _conditional_get
 
 
 def test_base_url_default():
@@ -37,6 +37,57 @@ def test_store_last_response():
     assert mock_client.last_response is resp
 
 
+@mock.patch("civis.base.retry_request")
+@mock.patch("civis.base.open_session")
+def test_conditional_get(mock_open_session, mock_retry_request):
+    endpoint = Endpoint({"api_key": "abc"}, client=mock.Mock(_retrying=None))
+    sess = mock_open_session.return_value.__enter__.return_value
+
+    mock_retry_request.return_value = mock.Mock(
+        ok=True, status_code=200, headers={"ETag": '"v1"'}
+    )
+    with _conditional_get(None) as conditional:
+        endpoint._make_request("GET", "scripts/1")
+    assert "If-None-Match" not in sess.prepare_request.call_args[0][0].headers
+    assert conditional.etag == '"v1"'
+    assert not conditional.not_modified
+
+    mock_retry_request.return_value = mock.Mock(ok=True, status_code=304, headers={})
+    with _conditional_get('"v1"') as conditional:
+        endpoint._make_request("GET", "scripts/1")
+    assert sess.prepare_request.call_args[0][0].headers["If-None-Match"] == '"v1"'
+    assert conditional.not_modified
+
+
+@mock.patch("civis.base.retry_request")
+@mock.patch("civis.base.open_session")
+def test_call_api_not_modified(mock_open_session, mock_retry_request):
+    client = mock.Mock(_retrying=None)
+    endpoint = Endpoint({"api_key": "abc"}, client=client, return_type="snake")
+
+    mock_retry_request.return_value = mock.Mock(
+        spec=requests.Response,
+        ok=True,
+        status_code=200,
+        headers={"ETag": '"v1"'},
+        content=b'{"state": "running"}',
+    )
+    mock_retry_request.return_value.json.return_value = {"state": "running"}
+    with _conditional_get(None) as conditional:
+        resp = endpoint._call_api("GET", "scripts/1")
+    assert resp.state == "running"
+    assert client.last_response is resp
+
+    not_modified = mock.Mock(spec=requests.Response, ok=True, status_code=304)
+    not_modified.headers = {}
+    mock_retry_request.return_value = not_modified
+    with _conditional_get(conditional.etag) as conditional:
+        assert endpoint._call_api("GET", "scripts/1") is not_modified
+    assert conditional.not_modified
+    # The last full response is kept.
+    assert client.last_response is resp
+
+
 def test_civis_api_error_empty_response():
     # Fake response object, try to trigger error
     # Make sure response.json() gets the JSON decode error
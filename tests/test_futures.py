@@ -46,6 +46,16 @@ def test_check_message_when_job_is_running():
     assert result._check_message(message) is False
 
 
+@mock.patch("civis.futures.APIClient")
+def test_default_client_created_lazily(mock_api_client):
+    future = CivisFuture(_create_poller_mock("running"), (1, 2))
+    mock_api_client.assert_not_called()
+    assert future.client is mock_api_client.return_value
+    assert future.client is mock_api_client.return_value
+    mock_api_client.assert_called_once_with()
+    future.cleanup()
+
+
 def test_poller_call_count_poll_on_creation_true():
     mock_civis = create_client_mock()
     poller = _create_poller_mock("succeeded")
@@ -1,14 +1,20 @@
 """Test the `civis.polling` module"""
 
+import asyncio
+import gc
+import os
 import time
+import threading
 from concurrent import futures
 import unittest
 from unittest import mock
 
 from civis.response import Response
-from civis.polling import PollableResult, _ResultPollingThread
+from civis.base import CivisJobFailure, _conditional_get_local
+from civis.polling import PollableResult, _POLL_SCHEDULER
 
 import pytest
+import requests
 
 
 class State:
@@ -76,33 +82,347 @@ class TestPolling(unittest.TestCase):
         assert poller.call_count > 0
 
     def test_poller_returns_none(self):
-        check_result = mock.Mock(
-            side_effect=[None, None, Response({"state": "success"})]
-        )
-        pollable_result = mock.Mock()
-        pollable_result._check_result = check_result
-        pollable_result._next_polling_interval = 0.01
-        polling_thread = _ResultPollingThread(pollable_result)
-        polling_thread.run()
-        assert check_result.call_count == 3
-
-    def test_reset_polling_thread(self):
+        poller = mock.Mock(side_effect=[None, None, Response({"state": "success"})])
+        pollable = PollableResult(poller, (), polling_interval=0.01)
+        pollable.result(timeout=5)
+        assert poller.call_count == 3
+
+    def test_reset_polling(self):
         pollable = PollableResult(
             mock.Mock(return_value=Response({"state": "running"})),
             poller_args=(),
             polling_interval=0.1,
         )
-        initial_polling_thread = pollable._polling_thread
+        pollable.done()  # Check status once to start polling
+        initial_token = pollable._poll_token
+        assert initial_token is not None
         assert pollable.polling_interval == 0.1
         assert pollable._next_polling_interval == 0.1
-        pollable._reset_polling_thread(0.2)
+        pollable._reset_polling(0.2)
         # Check that the polling interval was updated
         assert pollable.polling_interval == 0.2
         assert pollable._next_polling_interval == 0.2
-        # Check that the _polling_thread is a new thread
-        assert pollable._polling_thread != initial_polling_thread
-        # Check that the old thread was stopped
-        assert not initial_polling_thread.is_alive()
+        # Check that the old registration with the scheduler was dropped
+        assert pollable._poll_token is None
+        pollable.done()
+        assert pollable._poll_token is not None
+        assert pollable._poll_token is not initial_token
+
+    def test_polling_threads_shared(self):
+        poller = mock.Mock(return_value=Response({"state": "running"}))
+        pollables = [
+            PollableResult(poller, (), polling_interval=0.01) for _ in range(50)
+        ]
+        for pollable in pollables:
+            pollable.done()  # Check status once to start polling
+        time.sleep(0.1)
+        scheduler_threads = [
+            t for t in threading.enumerate() if t.name.startswith("civis-polling")
+        ]
+        assert len(scheduler_threads) <= 1 + _POLL_SCHEDULER._max_workers
+        assert all(t.daemon for t in scheduler_threads)
+        for pollable in pollables:
+            pollable.cleanup()
+
+    def test_polling_stops_after_cleanup(self):
+        poller = mock.Mock(return_value=Response({"state": "running"}))
+        pollable = PollableResult(poller, (), polling_interval=0.01)
+        pollable.done()  # Check status once to start polling
+        pollable.cleanup()
+        time.sleep(0.05)
+        call_count = poller.call_count
+        time.sleep(0.05)
+        assert poller.call_count == call_count
+
+    def test_cleanup_unschedules_polls(self):
+        poller = mock.Mock(return_value=Response({"state": "running"}))
+        pollable = PollableResult(poller, (), polling_interval=10)
+        pollable.done()  # Check status once to start polling
+        token = pollable._poll_token
+        assert any(entry[2] is token for entry in _POLL_SCHEDULER._heap)
+        pollable.cleanup()
+        assert not any(entry[2] is token for entry in _POLL_SCHEDULER._heap)
+        assert token not in _POLL_SCHEDULER._pollables
+
+    def test_polling_continues_without_reference(self):
+        poller = mock.Mock(
+            side_effect=[
+                Response({"state": "running"}),
+                Response({"state": "running"}),
+                Response({"state": "succeeded"}),
+            ]
+        )
+        done = threading.Event()
+        states = []
+
+        def callback(fut):
+            states.append(fut.result().state)
+            done.set()
+
+        pollable = PollableResult(poller, (), polling_interval=0.01)
+        pollable.add_done_callback(callback)
+        del pollable
+        gc.collect()
+        # The scheduler keeps the future alive until its job is done.
+        assert done.wait(timeout=5)
+        assert states == ["succeeded"]
+        assert poller.call_count == 3
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+    def test_polling_after_fork(self):
+        def poller():
+            return Response({"state": "succeeded"})
+
+        # Start the scheduler's threads in this process.
+        PollableResult(poller, (), polling_interval=0.01).result(timeout=5)
+        # A future that this process is still polling when it forks.
+        parent_poller = mock.Mock(return_value=Response({"state": "running"}))
+        parent_pollable = PollableResult(parent_poller, (), polling_interval=0.01)
+        parent_pollable.done()  # Check status once to start polling
+
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover
+            try:
+                # The child doesn't poll the parent's futures on its own.
+                calls_at_fork = parent_poller.call_count
+                time.sleep(0.2)
+                ok = parent_poller.call_count == calls_at_fork
+                # The polls that `result` itself makes before and after
+                # waiting don't finish the job, so finishing it is up to
+                # the scheduler.
+                running = Response({"state": "running"})
+                child_poller = mock.Mock(side_effect=[running, running, poller()])
+                pollable = PollableResult(child_poller, (), polling_interval=0.01)
+                ok = ok and pollable.result(timeout=3).state == "succeeded"
+                # A parent's future that the child uses starts polling again.
+                parent_poller.side_effect = [running, running, poller()]
+                ok = ok and parent_pollable.result(timeout=3).state == "succeeded"
+            except BaseException:
+                ok = False
+            os._exit(0 if ok else 1)
+        parent_pollable.cleanup()
+        _, status = os.waitpid(pid, 0)
+        assert os.waitstatus_to_exitcode(status) == 0
+
+    def test_slow_callbacks_dont_hold_up_polling(self):
+        n_slow = _POLL_SCHEDULER._max_workers
+        entered = threading.Semaphore(0)
+        release = threading.Event()
+
+        def slow_callback(fut):
+            entered.release()
+            release.wait(timeout=10)
+
+        running = Response({"state": "running"})
+        succeeded = Response({"state": "succeeded"})
+        try:
+            with mock.patch("civis.polling._IDLE_WORKER_TIMEOUT", 0.1):
+                for _ in range(n_slow):
+                    # The first poll, made by `add_done_callback`, happens
+                    # in this thread. The scheduler's workers make the rest.
+                    poller = mock.Mock(side_effect=[running, succeeded])
+                    pollable = PollableResult(poller, (), polling_interval=0.01)
+                    pollable.add_done_callback(slow_callback)
+                # Wait until the callbacks tie up every worker.
+                for _ in range(n_slow):
+                    assert entered.acquire(timeout=5)
+
+                poller = mock.Mock(side_effect=[running, running, succeeded])
+                pollable = PollableResult(poller, (), polling_interval=0.01)
+                start = time.monotonic()
+                assert pollable.result(timeout=5) is succeeded
+                assert time.monotonic() - start < 2
+        finally:
+            release.set()
+
+    def test_civis_state_cached_between_polls(self):
+        poller = mock.Mock(return_value=Response({"state": "running"}))
+        pollable = PollableResult(poller, (), polling_interval=10)
+        with mock.patch.object(
+            pollable, "_check_result", wraps=pollable._check_result
+        ) as check_result:
+            assert pollable._civis_state == "running"
+            assert pollable._civis_state == "running"
+            assert not pollable.done()
+        assert check_result.call_count == 1
+        pollable.cleanup()
+
+    def test_done_state_read_without_lock(self):
+        poller = mock.Mock(return_value=Response({"state": "succeeded"}))
+        pollable = PollableResult(poller, ())
+        pollable.done()
+        acquired, release = threading.Event(), threading.Event()
+
+        def hold_lock():
+            with pollable._condition:
+                acquired.set()
+                release.wait()
+
+        thread = threading.Thread(target=hold_lock)
+        thread.start()
+        acquired.wait()
+        try:
+            assert pollable.succeeded()
+            assert not pollable.failed()
+            assert pollable._check_result() is poller.return_value
+        finally:
+            release.set()
+            thread.join()
+
+    def test_repr(self):
+        poller = mock.Mock(return_value=Response({"state": "running"}))
+        pollable = PollableResult(poller, (), polling_interval=10)
+        prefix = f"<PollableResult at {id(pollable):#x}"
+        assert repr(pollable) == f"{prefix} state=running>"
+        pollable._set_api_result(Response({"state": "succeeded"}))
+        assert repr(pollable) == f"{prefix} state=succeeded returned Response>"
+
+        poller = mock.Mock(return_value=Response({"state": "failed", "error": "x"}))
+        pollable = PollableResult(poller, ())
+        prefix = f"<PollableResult at {id(pollable):#x}"
+        assert repr(pollable) == f"{prefix} state=failed raised CivisJobFailure>"
+
+    def test_failure_error_message(self):
+        with_error = Response({"state": "failed", "error": "Out of memory"})
+        pollable = PollableResult(mock.Mock(return_value=with_error), ())
+        assert pollable.exception()._original_err_msg == "Out of memory"
+
+        without_error = Response({"state": "failed"})
+        pollable = PollableResult(mock.Mock(return_value=without_error), ())
+        assert pollable.exception()._original_err_msg == str(without_error)
+
+    def test_transient_errors_retried(self):
+        success = Response({"state": "succeeded"})
+        poller = mock.Mock(side_effect=[requests.ConnectionError()] * 5 + [success])
+        pollable = PollableResult(poller, (), polling_interval=0.01)
+        while not pollable.done():
+            time.sleep(0.01)
+        assert pollable.result() is success
+        assert poller.call_count == 6
+
+    def test_transient_errors_give_up(self):
+        poller = mock.Mock(side_effect=requests.ConnectionError())
+        pollable = PollableResult(poller, (), polling_interval=0.01)
+        while not pollable.done():
+            time.sleep(0.01)
+        assert isinstance(pollable.exception(), requests.ConnectionError)
+        assert poller.call_count == 6
+
+    def test_geometric_polling_ignores_state_change(self):
+        states = ["queued", "queued", "running", "running"]
+        poller = mock.Mock(side_effect=[Response({"state": s}) for s in states])
+        pollable = PollableResult(poller, ())
+        pollable.cleanup()  # Poll by hand only.
+        intervals = []
+        for _ in states:
+            pollable._last_polled = None
+            pollable._check_result()
+            pollable.cleanup()
+            intervals.append(pollable._next_polling_interval)
+        assert intervals == pytest.approx([1.2, 1.44, 1.728, 2.0736])
+
+    def test_adaptive_polling(self):
+        states = ["queued", "queued", "queued", "running", "running", "running"]
+        poller = mock.Mock(side_effect=[Response({"state": s}) for s in states])
+        pollable = PollableResult(poller, (), polling_interval=5, adaptive=True)
+        pollable.cleanup()  # Poll by hand only.
+        intervals = []
+        for _ in states:
+            pollable._last_polled = None
+            pollable._check_result()
+            pollable.cleanup()
+            intervals.append(pollable._next_polling_interval)
+        # Doubles while the state is unchanged, and starts over when it changes.
+        assert intervals == [5, 10, 20, 5, 10, 20]
+
+    def test_adaptive_polling_capped(self):
+        poller = mock.Mock(return_value=Response({"state": "running"}))
+        pollable = PollableResult(poller, (), adaptive=True)
+        pollable.cleanup()  # Poll by hand only.
+        for _ in range(10):
+            pollable._last_polled = None
+            pollable._check_result()
+            pollable.cleanup()
+        assert pollable._next_polling_interval == 120
+
+    def test_await(self):
+        success = Response({"state": "succeeded"})
+        poller = mock.Mock(side_effect=[Response({"state": "running"}), success])
+        pollable = PollableResult(poller, (), polling_interval=0.01)
+
+        async def wait():
+            return await pollable
+
+        assert asyncio.run(wait()) is success
+
+    def test_await_failure(self):
+        poller = mock.Mock(return_value=Response({"state": "failed", "error": "x"}))
+        pollable = PollableResult(poller, (), polling_interval=0.01)
+
+        async def wait():
+            return await pollable
+
+        with pytest.raises(CivisJobFailure):
+            asyncio.run(wait())
+
+    def test_await_doesnt_poll_in_event_loop(self):
+        success = Response({"state": "succeeded"})
+        poll_threads = []
+
+        def poller():
+            poll_threads.append(threading.current_thread())
+            time.sleep(0.05)
+            return success if len(poll_threads) >= 2 else Response({"state": "running"})
+
+        pollable = PollableResult(poller, (), polling_interval=0.01)
+
+        async def wait():
+            return await pollable
+
+        assert asyncio.run(wait()) is success
+        assert len(poll_threads) >= 2
+        assert threading.current_thread() not in poll_threads
+
+    def test_await_timeout_doesnt_cancel(self):
+        poller = mock.Mock(return_value=Response({"state": "running"}))
+        pollable = PollableResult(poller, (), polling_interval=0.01)
+        loop_errors = []
+
+        async def wait():
+            loop = asyncio.get_running_loop()
+            loop.set_exception_handler(
+                lambda loop, context: loop_errors.append(context)
+            )
+            with mock.patch.object(pollable, "cancel") as cancel:
+                with pytest.raises(asyncio.TimeoutError):
+                    await asyncio.wait_for(pollable, 0.1)
+                # Let any callbacks scheduled by the cancellation run.
+                await asyncio.sleep(0.05)
+            cancel.assert_not_called()
+
+        asyncio.run(wait())
+        assert loop_errors == []
+        # The job is still being tracked.
+        assert not pollable.done()
+        pollable.cleanup()
+
+    def test_unchanged_result_reused(self):
+        running = Response({"state": "running"})
+
+        def poller():
+            conditional = _conditional_get_local.current
+            if conditional.etag is None:
+                conditional.etag = '"v1"'
+                return running
+            conditional.not_modified = True
+            return Response(None)
+
+        pollable = PollableResult(poller, (), polling_interval=0.01)
+        assert pollable._check_result() is running
+        time.sleep(0.02)
+        assert pollable._check_result() is running
+        assert pollable._last_etag == '"v1"'
+        pollable.cleanup()
 
     def test_geometric_polling(self):
         # To test polling, we make the poller function spit out a timestamp every time
@@ -1,12 +1,13 @@
 import json
 import os
+import re
 import tempfile
+import textwrap
 import time
 from collections import defaultdict, OrderedDict
 from unittest import mock
 
 import pytest
-from jsonref import JsonRef
 from requests.exceptions import HTTPError
 
 from civis.base import Endpoint
@@ -16,7 +17,7 @@ from civis.tests import create_client_mock
 
 
 with open(API_SPEC_PATH) as f:
-    API_SPEC = json.load(f, object_pairs_hook=OrderedDict)
+    API_SPEC = json.load(f)
 
 
 RESPONSE_DOC = """Returns
@@ -116,6 +117,24 @@ def test_exclude_resource():
     exclude = "feature_flags/"
     assert _resources.exclude_resource(exclude, "1.0")
     assert not _resources.exclude_resource(include, "1.0")
+    assert _resources.exclude_resource("feature_flags", "1.0")
+    assert _resources.exclude_resource("feature_flags/{id}", "1.0")
+    assert not _resources.exclude_resource("feature_flags_v2/", "1.0")
+
+
+@pytest.mark.parametrize(
+    "x,expected",
+    [
+        ({}, None),
+        ({"properties": {"a": 1}}, {"a": 1}),
+        ({"properties": {}}, None),
+        ({"items": {"properties": {"b": 2}}}, {"b": 2}),
+        ({"properties": {}, "items": {"properties": {"b": 2}}}, {"b": 2}),
+        ({"items": {"type": "string"}}, None),
+    ],
+)
+def test_get_properties(x, expected):
+    assert _resources.get_properties(x) == expected
 
 
 def test_property_type():
@@ -136,6 +155,10 @@ def test_name_and_type_doc():
     assert x == "a : str, optional"
     assert y == "    - a : str, optional"
     assert z == "a : str"
+    with mock.patch.object(_resources, "camel_to_snake") as mock_snake:
+        w = _resources.name_and_type_doc("A", prop, 0, snake_name="a")
+    assert w == "a : str"
+    mock_snake.assert_not_called()
 
 
 def test_docs_from_property():
@@ -391,6 +414,8 @@ def test_iterable_method():
     assert _resources.iterable_method("get", ["limit", "page_num"])
     assert not _resources.iterable_method("get", ["page_num"])
     assert not _resources.iterable_method("post", ["limit", "page_num"])
+    # A generator is only consumed once, whatever the parameter order.
+    assert _resources.iterable_method("get", (x for x in ["page_num", "limit"]))
 
 
 def test_split_method_params():
@@ -524,8 +549,33 @@ def test_parse_method_name():
     assert c == "list_containers_id_shares"
 
 
+def test_resolve_refs():
+    spec = OrderedDict(
+        {
+            "paths": {
+                "/a": {"schema": {"$ref": "#/definitions/A"}},
+                "/b": {"schema": {"$ref": "#/definitions/A"}},
+                "/c": {"schema": {"$ref": "#/definitions/a~1b"}},
+            },
+            "definitions": {
+                "A": {"properties": {"self": {"$ref": "#/definitions/A"}}},
+                "a/b": {"type": "string"},
+            },
+        }
+    )
+    original = json.dumps(spec)
+    resolved = _resources.resolve_refs(spec)
+
+    a = resolved["paths"]["/a"]["schema"]
+    assert a is resolved["paths"]["/b"]["schema"]
+    assert a["properties"]["self"] is a
+    assert resolved["paths"]["/c"]["schema"] == {"type": "string"}
+    assert isinstance(resolved, OrderedDict)
+    assert json.dumps(spec) == original
+
+
 def test_duplicate_names_generated_from_api_spec():
-    resolved_civis_api_spec = JsonRef.replace_refs(API_SPEC)
+    resolved_civis_api_spec = _resources.resolve_refs(API_SPEC)
     paths = resolved_civis_api_spec["paths"]
     classes = defaultdict(list)
     for path, ops in paths.items():
@@ -609,6 +659,51 @@ def test_create_method_multiple_values():
     assert str(excinfo.value) == "multiple values for argument 'foo'"
 
 
+@pytest.mark.parametrize(
+    "args,kwargs",
+    [
+        ((1, 2), {}),
+        ((1,), {"b": 2}),
+        ((), {"b": 2, "a": 1, "c": 3}),
+        ((1, 2), {"c": 3}),
+        ((1, 2, 3), {}),
+        ((1,), {"a": 1}),
+        ((1,), {}),
+        ((), {"c": 3}),
+    ],
+)
+def test_bind_arguments(args, kwargs):
+    sig = _resources.create_signature(
+        {"a": {"type": None}, "b": {"type": None}},
+        {"c": {"type": None, "default": None}},
+    )
+    try:
+        expected = dict(sig.bind(*args, **kwargs).arguments)
+    except TypeError as exc:
+        with pytest.raises(TypeError, match=re.escape(str(exc))):
+            _resources.bind_arguments(("a", "b"), args, kwargs)
+    else:
+        assert _resources.bind_arguments(("a", "b"), args, kwargs) == expected
+
+
+def test_shared_signature():
+    args = {"id": {"type": "int"}}
+    optional_args = {"limit": {"type": "int", "default": None}}
+    sig = _resources._shared_signature(args, optional_args)
+    assert sig == _resources.create_signature(args, optional_args)
+    assert sig is _resources._shared_signature(dict(args), dict(optional_args))
+
+    # Defaults that compare equal but differ in type aren't shared.
+    sig_1 = _resources._shared_signature({}, {"a": {"type": None, "default": 1}})
+    sig_true = _resources._shared_signature({}, {"a": {"type": None, "default": True}})
+    assert type(sig_1.parameters["a"].default) is int
+    assert sig_true.parameters["a"].default is True
+
+    # Unhashable defaults still work.
+    sig = _resources._shared_signature({}, {"a": {"type": None, "default": []}})
+    assert sig.parameters["a"].default == []
+
+
 def test_create_method_keyword_only():
     # Verify that optional arguments are keyword-only
     # (This language feature is only present in Python 3)
@@ -650,24 +745,50 @@ def test_generate_classes_maybe_cached(mock_parse, mock_gen, mock_open):
     mock_gen.assert_called_once_with(api_key, api_version)
     mock_gen.reset_mock()
 
-    # Handles OrderedDict
-    spec = OrderedDict({"test": True})
+    # Handles dict
+    spec = {"test": True}
     _resources.generate_classes_maybe_cached(spec, api_key, api_version)
     mock_parse.assert_called_once_with(spec, api_version)
     assert not mock_gen.called
 
     # Handles str
     mock_parse.reset_mock()
-    _resources.generate_classes_maybe_cached("mock", api_key, api_version)
+    _resources._generate_classes_from_file.cache_clear()
+    with mock.patch.object(_resources.os, "stat"):
+        _resources.generate_classes_maybe_cached("mock", api_key, api_version)
     mock_parse.assert_called_once_with(spec, api_version)
     assert not mock_gen.called
 
-    # Error when a regular dict is passed
-    bad_spec = {"test": True}
+    # Still handles OrderedDict
+    mock_parse.reset_mock()
+    _resources.generate_classes_maybe_cached(OrderedDict(spec), api_key, api_version)
+    mock_parse.assert_called_once_with(spec, api_version)
+
+    # Error when neither a dict nor a str is passed
+    bad_spec = [("test", True)]
     with pytest.raises(ValueError):
         _resources.generate_classes_maybe_cached(bad_spec, api_key, api_version)
 
 
+@mock.patch("civis.resources._resources.parse_api_spec", autospec=True)
+def test_generate_classes_maybe_cached_file(mock_parse, tmp_path):
+    _resources._generate_classes_from_file.cache_clear()
+    spec_path = tmp_path / "spec.json"
+    spec_path.write_text('{"test": true}')
+
+    # The same file is only parsed once.
+    for _ in range(2):
+        _resources.generate_classes_maybe_cached(str(spec_path), "mock", "1.0")
+    mock_parse.assert_called_once_with({"test": True}, "1.0")
+
+    # An updated file is parsed again.
+    spec_path.write_text('{"test": false}')
+    os.utime(spec_path, ns=(0, 0))
+    _resources.generate_classes_maybe_cached(str(spec_path), "mock", "1.0")
+    mock_parse.assert_called_with({"test": False}, "1.0")
+    assert mock_parse.call_count == 2
+
+
 @mock.patch("civis.resources._resources.parse_method", autospec=True)
 def test_parse_api_spec_names(mock_method):
     """Test that path parsing preserves underscore in resource name."""
@@ -736,3 +857,14 @@ def test_generate_classes_with_ttl_cache__expire_cache(mock_gen, mock_expire_tim
 @pytest.mark.parametrize("source, expected", [("ab_cd", "AbCd"), ("", "")])
 def test_snake_to_camel(source, expected):
     assert _resources._snake_to_camel(source) == expected
+
+
+@pytest.mark.parametrize(
+    "text", ["", "short", "  padded ", "two\nlines", "tab\there", "word " * 30]
+)
+@pytest.mark.parametrize("indent", ["", "    "])
+def test_wrap_doc(text, indent):
+    expected = textwrap.fill(
+        text, initial_indent=indent, subsequent_indent=indent, width=79
+    )
+    assert _resources._wrap_doc(text, indent) == expected
@@ -1,6 +1,10 @@
+import copy
+import gc
 import io
 import pickle
 import pprint
+import threading
+import weakref
 from string import ascii_lowercase
 from unittest import mock
 
@@ -72,16 +76,16 @@ def test_pagination():
         assert obj["id"] == indx + 1
         all_data.append(obj)
 
-        # Test lazy evaluation. Should make only make one call up until the
-        # first item of the second page is needed.
-        if indx < 3:
-            mock_endpoint._make_request.assert_called_once_with(
-                "GET", path, dict(params, **{"page_num": 1})
-            )
-        else:
-            mock_endpoint._make_request.assert_called_with(
-                "GET", path, dict(params, **{"page_num": 2})
-            )
+        # Test lazy evaluation. While a page is being iterated over,
+        # at most the requests for it and the next page have been made.
+        # (The next page is requested in the background.)
+        expected_calls = [
+            mock.call("GET", path, dict(params, page_num=page_num))
+            for page_num in ([1, 2] if indx < 3 else [1, 2, 3])
+        ]
+        calls = mock_endpoint._make_request.call_args_list
+        assert calls == expected_calls[: len(calls)]
+        assert len(calls) >= len(expected_calls) - 1
 
     # One extra call is made. Pagination is stopped since the response is
     # empty.
@@ -89,6 +93,56 @@ def test_pagination():
     assert len(all_data) == 5
 
 
+def test_pagination_prefetches_next_page():
+    second_page_requested = threading.Event()
+
+    def make_request(method, path, params):
+        if params["page_num"] == 2:
+            second_page_requested.set()
+        data = [{"id": params["page_num"]}] if params["page_num"] <= 2 else []
+        return _create_mock_response(data, {})
+
+    mock_endpoint = mock.MagicMock()
+    mock_endpoint._make_request.side_effect = make_request
+    mock_endpoint._return_type = "snake"
+    paginator = PaginatedResponse("/objects", {}, mock_endpoint)
+
+    assert next(paginator).id == 1
+    # The second page is requested before the caller asks for its items.
+    assert second_page_requested.wait(timeout=10)
+    assert [obj.id for obj in paginator] == [2]
+
+
+def test_pagination_releases_raw_response():
+    raw_responses = []
+
+    def make_request(method, path, params):
+        data = [{"id": 1}, {"id": 2}] if params["page_num"] == 1 else []
+        response = _create_mock_response(data, {})
+        raw_responses.append(weakref.ref(response))
+        return response
+
+    mock_endpoint = mock.MagicMock()
+    mock_endpoint._make_request.side_effect = make_request
+    mock_endpoint._return_type = "snake"
+    paginator = PaginatedResponse("/objects", {}, mock_endpoint)
+
+    first = next(paginator)
+    gc.collect()
+    # The first page's raw response isn't kept alive while its items are
+    # being iterated over.
+    assert raw_responses[0]() is None
+    assert first.id == 1
+    assert [obj.id for obj in paginator] == [2]
+
+
+def test_pagination_raw():
+    paginator, mock_endpoint = _make_paginated_response("/objects", {})
+    mock_endpoint._return_type = "raw"
+
+    assert list(paginator) == [{"id": i, "name": f"job_{i}"} for i in range(1, 6)]
+
+
 def test_iterator_interface():
     # Make sure that the PaginatedResponse implements `next` as expected
     paginator, _ = _make_paginated_response("/objects", {"param": "value"})
@@ -193,6 +247,60 @@ def test_rate_limit(headers, expected_calls_remaining, expected_rate_limit):
     assert response.rate_limit == expected_rate_limit
 
 
+def test_rate_limit_list_and_pagination():
+    headers = {"X-RateLimit-Remaining": "1", "X-RateLimit-Limit": "100"}
+    responses = convert_response_data_type([{"id": 1}, {"id": 2}], headers=headers)
+    mock_endpoint = mock.MagicMock()
+    mock_endpoint._make_request.side_effect = [
+        _create_mock_response([{"id": 3}, {"id": 4}], headers),
+        _create_mock_response([], headers),
+    ]
+    mock_endpoint._return_type = "snake"
+    responses.extend(PaginatedResponse("objects", {}, mock_endpoint))
+    assert [r.id for r in responses] == [1, 2, 3, 4]
+    for response in responses:
+        assert response.headers == headers
+        assert response.calls_remaining == 1
+        assert response.rate_limit == 100
+
+
+def test_list_items_with_different_keys():
+    data = [{"fooBar": 1}, {"fooBar": 2, "bazQux": 3}, {"FOO": 4}]
+    responses = convert_response_data_type(data)
+    assert responses == [{"foo_bar": 1}, {"foo_bar": 2, "baz_qux": 3}, {"foo": 4}]
+    assert responses[1].bazQux == 3
+
+
+def test_nested_values_wrapped_on_access():
+    json_data = {
+        "fooBar": {"bazQux": 1},
+        "items": [{"aB": 2}, 3],
+        "arguments": {"MY_VAR": 4},
+    }
+    response = Response(json_data)
+    assert isinstance(response._data_snake["foo_bar"], dict)
+
+    assert response.foo_bar == Response({"bazQux": 1})
+    assert isinstance(response._data_snake["foo_bar"], Response)
+    assert response.fooBar is response.foo_bar
+    assert isinstance(response._data_snake["items"], list)
+    assert isinstance(response._data_snake["arguments"], dict)
+
+    # Whole-response operations see wrapped values.
+    assert response == {
+        "foo_bar": {"baz_qux": 1},
+        "items": [{"a_b": 2}, 3],
+        "arguments": {"MY_VAR": 4},
+    }
+    assert response["items"][0].a_b == 2
+    assert response.arguments.MY_VAR == 4
+    assert repr(response) == (
+        "Response({'foo_bar': Response({'baz_qux': 1}), "
+        "'items': [Response({'a_b': 2}), 3], "
+        "'arguments': Response({'MY_VAR': 4})})"
+    )
+
+
 def test_response_is_immutable():
     """Test that the Response object is immutable.
 
@@ -248,6 +356,16 @@ def test_response_cross_compatibility():
     )
 
 
+def test_response_camel_case_only_for_original_keys():
+    response = Response({"fooBar": 123})
+    assert response["fooBar"] == response.fooBar == 123
+    # Only the original camelCase keys are aliases of the snake_case ones.
+    with pytest.raises(KeyError):
+        response["FooBar"]
+    with pytest.raises(AttributeError):
+        response.FooBar
+
+
 @pytest.mark.parametrize("key", ["arguments", "environmentVariables"])
 def test_response_keys_preserve_case(key):
     json_data = {key: {"FOO": 123, "FOO_BAR": 456}}
@@ -448,6 +566,11 @@ def test_eq():
 
     for not_response_or_dict in (789, "str", ["list"], ("tuple",), {"set"}, None):
         assert response != not_response_or_dict
+        assert not (response == not_response_or_dict)
+
+    assert response == response
+    # Other objects get a say in the comparison.
+    assert response == mock.ANY
 
 
 def test_response_is_pickleable():
@@ -459,6 +582,31 @@ def test_response_is_pickleable():
     assert response == unpickled
 
 
+def test_response_has_no_instance_dict():
+    response = Response({"fooBar": {"bazQux": 1}}, headers={"X-RateLimit-Limit": "1"})
+    assert not hasattr(response, "__dict__")
+    copied = copy.deepcopy(response)
+    assert copied == response
+    assert copied.rate_limit == 1
+    assert copied.foo_bar.baz_qux == copied.fooBar.bazQux == 1
+
+
+def test_response_setstate_from_old_pickle():
+    # Before Response had `__slots__`, its pickled state was its `__dict__`.
+    old_state = {
+        "json_data": {"fooBar": 1},
+        "headers": None,
+        "calls_remaining": None,
+        "rate_limit": None,
+        "_data_camel": {"fooBar": 1},
+        "_data_snake": {"foo_bar": 1},
+    }
+    response = Response.__new__(Response)
+    response.__setstate__(old_state)
+    assert response == Response({"fooBar": 1})
+    assert response.fooBar == 1
+
+
 def test_find_filter_with_kwargs():
     r1 = Response({"foo": 0, "bar": "a", "baz": True})
     r2 = Response({"foo": 1, "bar": "b", "baz": True})
@@ -1,6 +1,44 @@
+import pickle
 import shutil
+from unittest import mock
+
+from civis import run_joblib_func
 
 
 def test_civis_joblib_worker_command_available():
     command = "civis_joblib_worker"
     assert shutil.which(command), f"The `{command}` command is not available."
+
+
+def test_worker_func_uploads_result_from_file(monkeypatch):
+    monkeypatch.setenv("CIVIS_JOB_ID", "1")
+    monkeypatch.setenv("CIVIS_RUN_ID", "2")
+    uploaded = {}
+
+    def _file_to_civis(buf, name, **kwargs):
+        # The result is uploaded from a file on disk, which `file_to_civis`
+        # can split into parts if it's large.
+        uploaded["name"] = buf.name
+        uploaded["result"] = pickle.load(buf)
+        return 3
+
+    with (
+        mock.patch.object(run_joblib_func.civis, "APIClient") as mock_client,
+        mock.patch.object(
+            run_joblib_func,
+            "_robust_pickle_download",
+            return_value=(lambda: [1, 2, 3], None),
+        ),
+        mock.patch.object(
+            run_joblib_func, "_setup_remote_backend", return_value="sequential"
+        ),
+        mock.patch.object(
+            run_joblib_func, "_robust_file_to_civis", side_effect=_file_to_civis
+        ),
+    ):
+        run_joblib_func.worker_func(func_file_id=4)
+
+    assert uploaded["result"] == [1, 2, 3]
+    assert isinstance(uploaded["name"], str)
+    post_outputs = mock_client.return_value.scripts.post_containers_runs_outputs
+    post_outputs.assert_called_once_with("1", "2", "File", 3)
@@ -4,12 +4,14 @@ from unittest import mock
 
 import requests
 
+from civis import service_client
 from civis.base import CivisAPIError
 from civis.service_client import (
     ServiceClient,
     ServiceEndpoint,
     _get_service,
     _parse_service_path,
+    auth_service_session,
     parse_service_api_spec,
     to_camelcase,
 )
@@ -20,6 +22,14 @@ MOCK_SERVICE_ID = 0
 MOCK_URL = "www.survey-url.com"
 
 
+@pytest.fixture(autouse=True)
+def clear_deployment_classes():
+    # Don't let classes cached by one test leak into another.
+    service_client._DEPLOYMENT_CLASSES.clear()
+    yield
+    service_client._DEPLOYMENT_CLASSES.clear()
+
+
 @pytest.fixture
 def mock_swagger():
     return {
@@ -199,7 +209,7 @@ def test_generate_classes(url_mock, api_spec_mock, parse_mock, mock_swagger):
     sc = ServiceClient(MOCK_SERVICE_ID, root_path="/foo")
 
     classes = sc.generate_classes()
-    parse_mock.assert_called_once_with(api_spec_mock.return_value, root_path="/foo")
+    parse_mock.assert_called_with(api_spec_mock.return_value, root_path="/foo")
 
     assert "class" in classes
 
@@ -250,6 +260,25 @@ def test_get_base_url(get_service_mock, classes_mock):
     get_service_mock.assert_called_once_with(sc)
 
 
+@mock.patch("civis.service_client.ServiceClient.generate_classes_maybe_cached")
+@mock.patch("civis.service_client.APIClient")
+def test_auth_service_session_reuses_service(mock_client, classes_mock):
+    classes_mock.return_value = {}
+    service = {"current_url": MOCK_URL, "current_deployment": {"displayUrl": "auth"}}
+    mock_client.return_value.services.get.return_value = service
+    sc = ServiceClient(MOCK_SERVICE_ID)
+    session = mock.Mock()
+
+    auth_service_session(session, sc)
+    auth_service_session(session, sc)
+    session.get.assert_called_with("auth")
+    # The service was looked up only once, when the client was created.
+    assert mock_client.return_value.services.get.call_count == 1
+
+    auth_service_session(session, sc, refresh_service=True)
+    assert mock_client.return_value.services.get.call_count == 2
+
+
 @mock.patch("civis.service_client.ServiceClient.generate_classes_maybe_cached")
 @mock.patch("civis.service_client.APIClient")
 def test_get_service(mock_client, classes_mock):
@@ -285,6 +314,43 @@ def test_get_service__not_found(mock_client, classes_mock):
     assert str(excinfo.value) == expected_error
 
 
+@mock.patch("civis.service_client.parse_service_api_spec")
+@mock.patch("civis.service_client.ServiceClient.get_api_spec")
+@mock.patch("civis.service_client._get_service")
+def test_generate_classes_cached_per_deployment(
+    get_service_mock, api_spec_mock, parse_mock
+):
+    api_spec_mock.return_value = {}
+    parse_mock.return_value = {}
+
+    def _service(deployment_id):
+        return {
+            "current_url": MOCK_URL,
+            "current_deployment": {"deployment_id": deployment_id},
+        }
+
+    get_service_mock.return_value = _service(123)
+    ServiceClient(MOCK_SERVICE_ID)
+    ServiceClient(MOCK_SERVICE_ID)
+    # The second client reuses the classes generated for the first.
+    assert api_spec_mock.call_count == 1
+
+    # A new deployment of the service may serve a different spec.
+    get_service_mock.return_value = _service(456)
+    ServiceClient(MOCK_SERVICE_ID)
+    assert api_spec_mock.call_count == 2
+
+
+def test_deployment_classes_bounded():
+    for i in range(service_client._MAX_CACHED_DEPLOYMENTS + 2):
+        key = (MOCK_SERVICE_ID, i, "/endpoints", None)
+        assert service_client._get_deployment_classes(key, dict) == {}
+    cached = service_client._DEPLOYMENT_CLASSES
+    assert len(cached) == service_client._MAX_CACHED_DEPLOYMENTS
+    # The oldest entries were evicted.
+    assert (MOCK_SERVICE_ID, 0, "/endpoints", None) not in cached
+
+
 def test_build_path():
     service_client_mock = mock.Mock(_base_url="www.service_url.com", _root_path=None)
     se = ServiceEndpoint(service_client_mock)
@@ -320,6 +386,42 @@ def test_make_request(auth_mock, request_mock):
     assert response.json == expected_value
 
 
+@mock.patch("civis.service_client.requests.Session.request")
+@mock.patch("civis.service_client.auth_service_session")
+def test_make_request_reuses_session(auth_mock, request_mock):
+    se = ServiceEndpoint(mock.Mock(_base_url="www.service_url.com"))
+    request_mock.return_value = mock.Mock(ok=True, status_code=200)
+
+    se._make_request("get", "resources")
+    se._make_request("get", "resources")
+    assert auth_mock.call_count == 1
+    assert request_mock.call_count == 2
+
+    # Authenticate again and retry after a 401.
+    request_mock.side_effect = [
+        mock.Mock(ok=False, status_code=401),
+        mock.Mock(ok=True, status_code=200),
+    ]
+    response = se._make_request("get", "resources")
+    assert response.status_code == 200
+    assert auth_mock.call_count == 2
+    assert request_mock.call_count == 4
+
+
+@mock.patch("civis.service_client.auth_service_session")
+def test_get_session_replaces_stale_session_once(auth_mock):
+    se = ServiceEndpoint(mock.Mock(_base_url="www.service_url.com"))
+    stale = se._get_session()
+    with mock.patch.object(stale, "close") as close:
+        # Two threads that got a 401 with the same session.
+        fresh = se._get_session(stale=stale)
+        assert se._get_session(stale=stale) is fresh
+    assert fresh is not stale
+    assert auth_mock.call_count == 2
+    # The old session may still be in use by another thread.
+    close.assert_not_called()
+
+
 def test_tocamlecase():
     test_cases = [
         ("snake_case", "SnakeCase"),
@@ -96,3 +96,12 @@ def test_workflows_public_repo():
             except WorkflowValidationError as e:
                 print("Failed workflow yaml:", filename)
                 raise e
+
+
+def test_schemas_built_lazily():
+    from civis.workflows import _schemas
+
+    assert "WORKFLOW_SCHEMA" not in vars(_schemas)
+    assert _schemas.WORKFLOW_SCHEMA is _schemas.WORKFLOW_SCHEMA
+    with pytest.raises(AttributeError):
+        _schemas.NOT_A_SCHEMA